@@ -0,0 +1,79 @@
+# The Iterator Examples as a Package
+# ----------------------------------
+# Installed as `listen_and_learn_code.iterator` (see `pyproject.toml`). Importing the package loads
+# none of the modules in this folder: a name like `MyIterator` or `chunked_views` is looked up in
+# `_EXPORTS` by the module-level `__getattr__` the first time it is used, and only then is its module
+# imported. Optional dependencies (NumPy, more_itertools) are imported by the modules that need
+# them, so code that only uses `MyIterator` never pays for them.
+#
+# The modules can still be run on their own, from this folder (`python checkpoint.py`) or as part
+# of the package (`python -m listen_and_learn_code.iterator.checkpoint`).
+
+import importlib
+
+_EXPORTS = {
+    "MyIterator": "basic_iterator_vs_for_loop",
+    "process_collection": "basic_iterator_vs_for_loop",
+    "MmapIterator": "mmap_file_iterator",
+    "BufferedSink": "output_sinks",
+    "FileSink": "output_sinks",
+    "MemorySink": "output_sinks",
+    "StdoutSink": "output_sinks",
+    "chunked_views": "buffer_chunked",
+    "Mod": "counting",
+    "count": "counting",
+    "count_distinct_permutations": "multiset_permutations",
+    "parallel_distinct_permutations": "multiset_permutations",
+    "permutations_range": "multiset_permutations",
+    "rank_permutation": "multiset_permutations",
+    "unrank_permutation": "multiset_permutations",
+    "ChunkResult": "parallel_chunked",
+    "parallel_map_chunks": "parallel_chunked",
+    "MyAsyncIterator": "async_iterator",
+    "process_collection_async": "async_iterator",
+    "RollingBlock": "sliding_window_iterator",
+    "SlidingWindow": "sliding_window_iterator",
+    "WindowView": "sliding_window_iterator",
+    "rolling_max": "sliding_window_iterator",
+    "rolling_mean": "sliding_window_iterator",
+    "rolling_min": "sliding_window_iterator",
+    "rolling_stream": "sliding_window_iterator",
+    "rolling_sum": "sliding_window_iterator",
+    "CheckpointedIterator": "checkpoint",
+    "SeekableChunks": "checkpoint",
+    "load_checkpoint": "checkpoint",
+    "save_checkpoint": "checkpoint",
+}
+
+_SUBMODULES = {
+    "async_iterator",
+    "basic_iterator_vs_for_loop",
+    "buffer_chunked",
+    "checkpoint",
+    "counting",
+    "iteration_benchmark",
+    "mmap_file_iterator",
+    "more_itertools_iterator_examples",
+    "multiset_permutations",
+    "output_sinks",
+    "parallel_chunked",
+    "sliding_window_iterator",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Stored as a regular global, so `__getattr__` is only called once per name.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | _SUBMODULES)
@@ -0,0 +1,173 @@
+# Asynchronous Iterator and `process_collection`
+# -----------------------------------------------
+# `MyIterator` and `process_collection` are synchronous: while they wait for the next item, nothing
+# else can run. When items arrive from sockets or disk inside an `asyncio` program, that blocks the
+# whole event loop. The asynchronous versions use `__aiter__` / `__anext__` and `async for` instead,
+# so waiting for an item gives control back to the event loop.
+#
+# `process_collection_async` splits the work into a producer and a consumer:
+# - the producer pulls items from the source into a bounded `asyncio.Queue`; when the queue is full,
+#   `await queue.put(...)` pauses the producer, which is how a slow consumer pushes back on a fast source,
+# - the consumer takes up to `batch_size` items at a time from the queue and hands each batch to
+#   `handler`, with at most `concurrency` batches being handled at the same time (an `asyncio.Semaphore`).
+
+import asyncio
+import inspect
+
+
+class MyAsyncIterator:
+    def __init__(self, collection):
+        # Like `MyIterator`, we remember the collection and our position in it.
+        self.collection = collection
+        self.index = 0
+
+    def __aiter__(self):
+        # The asynchronous counterpart of `__iter__`, used by `async for`.
+        return self
+
+    async def __anext__(self):
+        # The asynchronous counterpart of `__next__`. Instead of `StopIteration`,
+        # the end of the iteration is signalled with `StopAsyncIteration`.
+        if self.index < len(self.collection):
+            item = self.collection[self.index]
+            self.index += 1
+            return item
+        raise StopAsyncIteration
+
+
+# A unique object that tells the consumer the producer has finished.
+_DONE = object()
+
+
+async def _print_batch(batch):
+    for item in batch:
+        print(f"Processing item: {item}")
+
+
+async def process_collection_async(source, handler=None, concurrency=4, queue_size=1024, batch_size=64):
+    # `source` may be an async iterable or a plain collection. `handler` receives a list of items and may
+    # be a coroutine function or a regular function. Returns the number of items processed.
+    # A `queue_size` of 0 means an unbounded queue, as for `asyncio.Queue`, so there is no backpressure.
+    if concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+    if queue_size < 0:
+        raise ValueError("Queue size must not be negative")
+    if not hasattr(source, "__aiter__"):
+        source = MyAsyncIterator(source)
+    handler = handler or _print_batch
+    is_coroutine = inspect.iscoroutinefunction(handler)
+    queue = asyncio.Queue(maxsize=queue_size)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def produce():
+        try:
+            async for item in source:
+                await queue.put(item)  # Waits here while the queue is full: backpressure.
+        finally:
+            await queue.put(_DONE)
+
+    async def handle(batch):
+        try:
+            if is_coroutine:
+                await handler(batch)
+            else:
+                handler(batch)
+        finally:
+            semaphore.release()
+
+    producer = asyncio.create_task(produce())
+    tasks = set()
+    failures = []
+
+    def finished(task):
+        tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            failures.append(task.exception())
+
+    processed = 0
+    done = False
+    try:
+        while not done:
+            if failures:
+                # Stop at the first failed batch instead of feeding the handler more work.
+                raise failures[0]
+            # Wait for one item, then take whatever else is already queued, up to a full batch.
+            batch = [await queue.get()]
+            while len(batch) < batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            if batch[-1] is _DONE:
+                batch.pop()
+                done = True
+            if not batch:
+                break
+            await semaphore.acquire()
+            task = asyncio.create_task(handle(batch))
+            tasks.add(task)
+            task.add_done_callback(finished)
+            processed += len(batch)
+        # Re-raises a failure of the source, if there was one.
+        await producer
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if failures:
+            raise failures[0]
+    finally:
+        producer.cancel()
+        for task in tasks:
+            task.cancel()
+    return processed
+
+
+# Test harness: async versus sync throughput
+# ------------------------------------------
+# A local, in-process producer stands in for a socket. Both paths format the same lines into memory,
+# so the numbers compare the iteration machinery rather than the terminal.
+async def _local_producer(count, yield_every=256):
+    for item in range(count):
+        if item % yield_every == 0:
+            await asyncio.sleep(0)  # Gives the event loop a chance to run, like a socket read would.
+        yield item
+
+
+def benchmark(item_count=500_000):
+    # Only the benchmark compares against the synchronous version, so its modules are imported here.
+    import time
+
+    if __package__:
+        from .basic_iterator_vs_for_loop import process_collection
+        from .output_sinks import MemorySink
+    else:  # Run as a script from this folder
+        from basic_iterator_vs_for_loop import process_collection
+        from output_sinks import MemorySink
+
+    sync_sink = MemorySink()
+    start = time.perf_counter()
+    process_collection(range(item_count), sync_sink)
+    sync_rate = item_count / (time.perf_counter() - start)
+
+    async_sink = MemorySink()
+
+    def write_batch(batch):
+        for item in batch:
+            async_sink.write(f"Processing item: {item}\n")
+
+    start = time.perf_counter()
+    processed = asyncio.run(process_collection_async(_local_producer(item_count), write_batch, batch_size=256))
+    async_rate = processed / (time.perf_counter() - start)
+    assert async_sink.getvalue() == sync_sink.getvalue()
+    return {"sync": sync_rate, "async": async_rate}
+
+
+# Example usage:
+if __name__ == "__main__":
+
+    async def main():
+        async for item in MyAsyncIterator([1, 2, 3]):
+            print(f"Async item: {item}")
+        await process_collection_async([1, 2, 3, 4], batch_size=2)
+
+    asyncio.run(main())
+
+    for path_name, items_per_second in benchmark().items():
+        print(f"{path_name:>5}: {items_per_second:,.0f} items/sec")
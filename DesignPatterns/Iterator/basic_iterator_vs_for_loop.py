@@ -1,18 +1,30 @@
 # Simple Function with a `for` Loop
 # ---------------------------------
 # This function takes a collection (like a list) and processes each item using a `for` loop.
-# It prints each item in the collection as it iterates through it.
+# It prints each item in the collection as it iterates through it, or hands it to an optional output sink.
 
 
-def process_collection(collection):
+def process_collection(collection, sink=None):
     # The `for` loop automatically handles the iteration over the collection.
+    if sink is None:
+        for item in collection:
+            print(f"Processing item: {item}")
+        return
+
+    # With a sink (see `output_sinks.py`), the lines are collected in a buffer and written
+    # in large blocks, instead of paying for one `print` call and one flush per item.
+    write = sink.write
     for item in collection:
-        print(f"Processing item: {item}")
+        write(f"Processing item: {item}\n")
+    sink.flush()
 
 
 # Example usage of the simple function:
-my_list = [1, 2, 3, 4]  # A sample list to process
-process_collection(my_list)  # Call the function to process the list
+# The examples only run when this file is executed directly, so other modules
+# in this folder can import `process_collection` and `MyIterator` without side effects.
+if __name__ == "__main__":
+    my_list = [1, 2, 3, 4]  # A sample list to process
+    process_collection(my_list)  # Call the function to process the list
 
 
 # Custom Iterator Class
@@ -45,15 +57,90 @@ class MyIterator:
             # When there are no more items to return, raise StopIteration to signal the end of the iteration.
             raise StopIteration
 
+    def tell(self):
+        # The position of the next item, so a checkpoint (see `checkpoint.py`) can remember where we were.
+        return self.index
+
+    def seek(self, position):
+        # Jumps straight to `position`, e.g. to resume from a checkpoint without replaying the items before it.
+        if position < 0:
+            raise ValueError("Position must not be negative")
+        self.index = position
+
+    def __length_hint__(self):
+        # `__length_hint__` tells `list()`, `bytearray()` and friends how many items are left,
+        # so they can allocate their storage once instead of growing it while they iterate.
+        return max(len(self.collection) - self.index, 0)
+
+    def next_batch(self, n):
+        # `next_batch` returns up to `n` items with a single method call instead of `n` calls to `__next__`.
+        # For collections that support the buffer protocol (bytes, bytearray, array.array) the batch is a
+        # `memoryview` slice, which shares memory with the collection instead of copying it. NumPy arrays
+        # are sliced directly, because their slices already are views (and memoryviews cannot represent
+        # every dtype). For everything else (lists, tuples, strings, ranges) it is a plain slice.
+        # An empty batch means the iterator is exhausted.
+        if n < 1:
+            raise ValueError("Batch size must be at least 1")
+        start = self.index
+        stop = min(start + n, len(self.collection))
+        if start >= stop:
+            return self._sliceable()[0:0]
+        self.index = stop
+        return self._sliceable()[start:stop]
+
+    def batches(self, n):
+        # A generator that keeps calling `next_batch` until the collection is used up.
+        # The consumer pays one Python-level call per batch instead of one per item.
+        while True:
+            batch = self.next_batch(n)
+            if not len(batch):
+                return
+            yield batch
+
+    def _sliceable(self):
+        # The memoryview is created lazily on the first batch, so item-by-item iteration
+        # never pins the buffer (a `bytearray` cannot be resized while a view on it exists).
+        try:
+            return self._view
+        except AttributeError:
+            if hasattr(self.collection, "__array_interface__"):
+                # A NumPy array (or a look-alike): its slices share memory already.
+                self._view = self.collection
+                return self._view
+            try:
+                self._view = memoryview(self.collection)
+            except (TypeError, ValueError):
+                # The collection does not support the buffer protocol (TypeError), or its items
+                # have no buffer format (ValueError), so we slice it directly.
+                self._view = self.collection
+            return self._view
+
 
 # Example usage of the custom iterator class:
-my_list = [1, 2, 3, 4]  # A sample list to process
-my_iterator = MyIterator(my_list)  # Create an instance of the iterator class
+if __name__ == "__main__":
+    my_list = [1, 2, 3, 4]  # A sample list to process
+    my_iterator = MyIterator(my_list)  # Create an instance of the iterator class
+
+    # Using the custom iterator in a `for` loop:
+    # The `for` loop will internally call the `__iter__` method first, and then repeatedly call `__next__`.
+    for item in my_iterator:
+        print(f"Processing item: {item}")
+
+
+# Batched Iteration
+# -----------------
+# Calling `__next__` once per item is fine for small collections, but for buffers with millions
+# of elements the per-call overhead dominates. `next_batch` and `batches` hand out whole slices instead.
+if __name__ == "__main__":
+    from array import array
+
+    numbers = array("i", range(10))  # A buffer-protocol collection of ten integers
+    for batch in MyIterator(numbers).batches(4):
+        # Each batch is a memoryview: no items are copied until we ask for them.
+        print(f"Processing batch: {batch.tolist()}")
 
-# Using the custom iterator in a `for` loop:
-# The `for` loop will internally call the `__iter__` method first, and then repeatedly call `__next__`.
-for item in my_iterator:
-    print(f"Processing item: {item}")
+    # `list()` uses `__length_hint__` to size its result up front.
+    print(list(MyIterator(my_list)))
 
 
 # Explanation of Key Differences:
@@ -69,6 +156,8 @@ for item in my_iterator:
 #    - This approach provides more control and allows the iteration process to be reused and customized.
 #    - The `__iter__` method ensures the object can be used in a `for` loop, while `__next__` handles the retrieval of each item.
 #    - The `StopIteration` exception is used to signal when the iteration is complete, which the `for` loop automatically handles.
+#    - `next_batch` and `batches` let a consumer take many items per call, using zero-copy memoryview slices
+#      for buffer-protocol collections, and `__length_hint__` lets `list()` preallocate.
 
 # Conclusion:
 # ------------
@@ -0,0 +1,148 @@
+# Zero-Copy Chunking for Numeric Data
+# -----------------------------------
+# `more_itertools.chunked` builds a brand new list for every chunk. That is exactly what we want
+# for arbitrary iterables, but for numeric data that already sits in one contiguous block of memory
+# (a NumPy array, an `array.array`, a `bytearray`) copying every element into Python lists is wasted work.
+#
+# `chunked_views` yields views into the original data instead:
+# - NumPy arrays are cut along their first axis with a strided view, so every chunk shares memory with the input.
+# - Other buffer-protocol objects are sliced through a `memoryview`.
+# - Anything else falls back to `more_itertools.chunked`.
+#
+# Vectorized code usually wants every chunk to have the same shape, so the last, shorter chunk can be
+# padded with `fill_value` (`pad=True`, which copies only that one chunk) or skipped (`drop_last=True`).
+#
+# NumPy is never imported by this module: an array can only be passed in once NumPy is loaded, so
+# `chunked_views` looks it up in `sys.modules` instead of paying for the import up front.
+
+import struct
+import sys
+from array import array
+
+
+def chunked_views(data, n, pad=False, fill_value=0, drop_last=False):
+    if n < 1:
+        raise ValueError("Chunk size must be at least 1")
+    if pad and drop_last:
+        raise ValueError("Use either pad or drop_last, not both")
+
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(data, np.ndarray):
+        return _ndarray_chunks(data, n, pad, fill_value, drop_last)
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return _iterable_chunks(data, n, pad, fill_value, drop_last)
+    return _memoryview_chunks(view, n, pad, fill_value, drop_last)
+
+
+def _ndarray_chunks(data, n, pad, fill_value, drop_last):
+    import numpy as np
+    from numpy.lib.stride_tricks import as_strided
+
+    if data.ndim == 0:
+        raise ValueError("Cannot chunk a 0-dimensional array")
+    full, remainder = divmod(len(data), n)
+
+    # One strided view describes all full chunks at once: the first axis steps `n` rows at a time,
+    # the second axis steps one row at a time. No element is copied.
+    row_stride = data.strides[0]
+    blocks = as_strided(
+        data,
+        shape=(full, n) + data.shape[1:],
+        strides=(row_stride * n,) + data.strides,
+        writeable=data.flags.writeable,
+    )
+    yield from blocks
+
+    if remainder and not drop_last:
+        tail = data[full * n :]
+        if pad:
+            padded = np.full((n,) + data.shape[1:], fill_value, dtype=data.dtype)
+            padded[:remainder] = tail
+            tail = padded
+        yield tail
+
+
+def _memoryview_chunks(view, n, pad, fill_value, drop_last):
+    if view.ndim != 1:
+        # Memoryviews can only be sliced along one dimension, so we flatten C-contiguous buffers.
+        view = view.cast("B").cast(view.format)
+    full, remainder = divmod(len(view), n)
+    if remainder and pad:
+        # Checked before the first chunk, so a format we cannot pad fails up front.
+        fill = _fill_bytes(view, fill_value)
+    for start in range(0, full * n, n):
+        yield view[start : start + n]
+
+    if remainder and not drop_last:
+        tail = view[full * n :]
+        if pad:
+            # The padded chunk is built from raw bytes, which works for every item format
+            # (`array` only knows its own typecodes, so it would reject 'c' or '?').
+            padded = bytearray(tail.tobytes())
+            padded += fill * (n - remainder)
+            tail = memoryview(padded).cast(tail.format)
+        yield tail
+
+
+def _fill_bytes(view, fill_value):
+    # The bytes of one `fill_value` item in the format of `view`.
+    try:
+        memoryview(b"").cast(view.format)
+    except ValueError:
+        raise ValueError(f"Cannot pad buffers with format {view.format!r}, use drop_last or a NumPy array") from None
+    try:
+        fill = struct.pack(view.format, fill_value)
+    except struct.error:
+        if fill_value != 0:
+            raise
+        # The default fill value means zero bytes, also for formats that 0 cannot be packed into, like 'c'.
+        fill = bytes(view.itemsize)
+    return fill
+
+
+def _iterable_chunks(iterable, n, pad, fill_value, drop_last):
+    # Only this fallback needs more_itertools, so it is imported on first use instead of with the module.
+    from more_itertools import chunked
+
+    for chunk in chunked(iterable, n):
+        if len(chunk) < n:
+            if drop_last:
+                return
+            if pad:
+                chunk.extend([fill_value] * (n - len(chunk)))
+        yield chunk
+
+
+# Example usage of `chunked_views`:
+if __name__ == "__main__":
+    # A plain iterable still goes through `more_itertools.chunked`.
+    for chunk in chunked_views(range(10), 3, pad=True, fill_value=-1):
+        print(chunk)
+    # Output:
+    # [0, 1, 2]
+    # [3, 4, 5]
+    # [6, 7, 8]
+    # [9, -1, -1]
+
+    # An `array.array` is sliced through a memoryview, so the chunks share its memory.
+    for chunk in chunked_views(array("d", range(10)), 4, drop_last=True):
+        print(chunk.tolist())
+    # Output:
+    # [0.0, 1.0, 2.0, 3.0]
+    # [4.0, 5.0, 6.0, 7.0]
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        values = np.arange(10)
+        chunks = list(chunked_views(values, 4, pad=True))
+        # Every full chunk is a view: writing through it changes the original array.
+        chunks[0][0] = 100
+        print(values[0], [chunk.tolist() for chunk in chunks])
+        # Output:
+        # 100 [[100, 1, 2, 3], [4, 5, 6, 7], [8, 9, 0, 0]]
@@ -0,0 +1,295 @@
+# Checkpointed, Resumable Iteration
+# ---------------------------------
+# `MyIterator` keeps its position in `self.index`, in memory only. When a long run over hundreds of
+# millions of items dies, that position is gone and we have to start again from item 0.
+#
+# `CheckpointedIterator` wraps any iterator and every so often writes its position, plus a small
+# user-defined `state` dictionary, to a checkpoint file. When it is created again with the same file
+# it continues where the last checkpoint left off:
+# - Sources with `tell()` and `seek()` (`MyIterator`, `MmapIterator`, `SeekableChunks`) jump
+#   straight to the saved position, so resuming costs nothing, however far the run got.
+# - Any other iterator (a generator pipeline, say) is replayed: the items before the checkpoint are
+#   read again and thrown away. That is slower, but it works for every source.
+#
+# A checkpoint is written to a temporary file in the same directory and then renamed over the old
+# one with `os.replace`, which is atomic: after a crash the file holds either the old or the new
+# checkpoint, never half of one. How often we checkpoint is set by item count and/or time; every
+# checkpoint costs a file write and an fsync, so `checkpoints` and `checkpoint_seconds` count them.
+#
+# The position is saved when the next item is requested, so it covers the items the consumer has
+# finished with. After a crash, at most the items since the last checkpoint are processed again.
+
+import json
+import os
+import tempfile
+import time
+from itertools import islice
+
+if __package__:
+    from .basic_iterator_vs_for_loop import MyIterator
+else:  # Run as a script from this folder
+    from basic_iterator_vs_for_loop import MyIterator
+
+
+def save_checkpoint(path, checkpoint):
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "w") as file:
+            json.dump(checkpoint, file)
+            file.flush()
+            os.fsync(file.fileno())  # The data must be on disk before the rename makes it visible.
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        # Syncing the directory makes the rename itself survive a power failure.
+        directory_descriptor = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory_descriptor)
+        finally:
+            os.close(directory_descriptor)
+
+
+def load_checkpoint(path):
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+class CheckpointedIterator:
+    def __init__(self, source, path, every_items=10_000, every_seconds=None, state=None):
+        # `every_items` and `every_seconds` can be combined; a checkpoint is written as soon as
+        # either is reached. With both set to None, only `checkpoint()` and the end of the
+        # iteration write one.
+        # `state` is a JSON-serialisable dict that is saved with every checkpoint and restored on
+        # resume, e.g. for running totals. The consumer updates `self.state` while iterating.
+        if every_items is not None and every_items < 1:
+            raise ValueError("every_items must be at least 1")
+        self.source = iter(source)
+        self.path = path
+        self.every_items = every_items
+        self.every_seconds = every_seconds
+        self.seekable = hasattr(self.source, "tell") and hasattr(self.source, "seek")
+        self.state = dict(state or {})
+
+        self.items = 0  # Items handed out, including those covered by the checkpoint we resumed from
+        self.resumed_from = None
+        self.replayed = 0
+        self.checkpoints = 0
+        self.checkpoint_seconds = 0.0
+        self.finished = False
+
+        checkpoint = load_checkpoint(path)
+        if checkpoint is not None:
+            self._resume(checkpoint)
+        self._since_checkpoint = 0
+        self._handed_out = False
+        self._deadline = None if every_seconds is None else time.monotonic() + every_seconds
+
+    def _resume(self, checkpoint):
+        self.resumed_from = checkpoint["position"]
+        self.items = checkpoint["items"]
+        self.state = checkpoint["state"]
+        self.finished = checkpoint["finished"]
+        if self.seekable:
+            self.source.seek(checkpoint["position"])
+        else:
+            # Without `seek`, the only way to get back to the position is to read up to it again.
+            next(islice(self.source, checkpoint["items"], checkpoint["items"]), None)
+            self.replayed = checkpoint["items"]
+
+    def position(self):
+        return self.source.tell() if self.seekable else self.items
+
+    def checkpoint(self):
+        start = time.perf_counter()
+        save_checkpoint(self.path, {
+            "position": self.position(),
+            "items": self.items,
+            "state": self.state,
+            "finished": self.finished,
+            "saved_at": time.time(),
+        })
+        self.checkpoint_seconds += time.perf_counter() - start
+        self.checkpoints += 1
+        self._since_checkpoint = 0
+        if self.every_seconds is not None:
+            self._deadline = time.monotonic() + self.every_seconds
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.finished:
+            raise StopIteration
+        # Asking for the next item means the consumer is done with the previous one,
+        # so this is the moment at which the position can be saved.
+        if self._handed_out and (
+            (self.every_items is not None and self._since_checkpoint >= self.every_items)
+            or (self._deadline is not None and time.monotonic() >= self._deadline)
+        ):
+            self.checkpoint()
+        try:
+            item = next(self.source)
+        except StopIteration:
+            self.finished = True
+            self.checkpoint()
+            raise
+        self.items += 1
+        self._since_checkpoint += 1
+        self._handed_out = True
+        return item
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # On a clean exit (e.g. `break`), we save how far we got. After an error we keep the
+        # last periodic checkpoint: the item that was being processed did not finish.
+        if exc_type is None and self._since_checkpoint:
+            self.checkpoint()
+
+
+class SeekableChunks:
+    # Chunks of a buffer (see `buffer_chunked.py`) with a position that is the number of chunks
+    # handed out, so a checkpointed run over the chunks can seek straight back to chunk `k`.
+
+    def __init__(self, data, n, **chunk_options):
+        self.data = data
+        self.n = n
+        self.chunk_options = chunk_options
+        self.seek(0)
+
+    def tell(self):
+        return self.index
+
+    def seek(self, index):
+        if index < 0:
+            raise ValueError("Chunk index must not be negative")
+        # `chunked_views` slices the buffer without copying, so starting at chunk `index` is free.
+        # It is imported here because `buffer_chunked` loads NumPy, which plain checkpointing does not need.
+        if __package__:
+            from .buffer_chunked import chunked_views
+        else:
+            from buffer_chunked import chunked_views
+
+        self.index = index
+        self._chunks = chunked_views(memoryview(self.data)[index * self.n :], self.n, **self.chunk_options)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunk = next(self._chunks)
+        self.index += 1
+        return chunk
+
+
+def benchmark(item_count=1_000_000, frequencies=(1_000, 10_000, 100_000)):
+    # The cost of checkpointing `item_count` items, in nanoseconds per item, for a few
+    # checkpoint frequencies, next to iterating the same `MyIterator` without checkpoints.
+    items = range(item_count)
+    results = {}
+    start = time.perf_counter()
+    for _ in MyIterator(items):
+        pass
+    results["no checkpoints"] = (time.perf_counter() - start) / item_count * 1e9
+
+    with tempfile.TemporaryDirectory() as directory:
+        for every_items in frequencies:
+            path = os.path.join(directory, f"every-{every_items}.json")
+            iterator = CheckpointedIterator(MyIterator(items), path, every_items=every_items)
+            start = time.perf_counter()
+            for _ in iterator:
+                pass
+            elapsed = time.perf_counter() - start
+            results[f"every {every_items:,} items"] = elapsed / item_count * 1e9
+            results[f"every {every_items:,} items, in checkpoints"] = iterator.checkpoint_seconds / item_count * 1e9
+    return results
+
+
+# Example usage of `CheckpointedIterator`:
+if __name__ == "__main__":
+    from array import array
+
+    if __package__:
+        from .basic_iterator_vs_for_loop import process_collection
+        from .mmap_file_iterator import MmapIterator
+        from .output_sinks import MemorySink
+    else:
+        from basic_iterator_vs_for_loop import process_collection
+        from mmap_file_iterator import MmapIterator
+        from output_sinks import MemorySink
+
+    def run(iterator, crash_after=None):
+        # Adds up the items, keeping the running total in the checkpointed state, and
+        # optionally "crashes" after `crash_after` items.
+        try:
+            with iterator:
+                for number, item in enumerate(iterator, 1):
+                    iterator.state["total"] = iterator.state.get("total", 0) + int(item)
+                    if number == crash_after:
+                        raise RuntimeError("Simulated crash")
+        except RuntimeError as error:
+            print(f"{error} after item {iterator.items}, last checkpoint at {load_checkpoint(iterator.path)['items']}")
+        return iterator
+
+    with tempfile.TemporaryDirectory() as directory:
+        # A seekable source: MyIterator jumps back to the checkpointed index.
+        path = os.path.join(directory, "numbers.json")
+        run(CheckpointedIterator(MyIterator(range(100)), path, every_items=25), crash_after=60)
+        resumed = run(CheckpointedIterator(MyIterator(range(100)), path, every_items=25))
+        print(resumed.resumed_from, resumed.replayed, resumed.state["total"], sum(range(100)))
+        # Output:
+        # Simulated crash after item 60, last checkpoint at 50
+        # 50 0 4950 4950
+
+        # A generator cannot seek, so the first items are replayed.
+        path = os.path.join(directory, "generator.json")
+        run(CheckpointedIterator((number * 2 for number in range(100)), path, every_items=25), crash_after=60)
+        resumed = run(CheckpointedIterator((number * 2 for number in range(100)), path, every_items=25))
+        print(resumed.resumed_from, resumed.replayed, resumed.state["total"], sum(range(0, 200, 2)))
+        # Output:
+        # Simulated crash after item 60, last checkpoint at 50
+        # 50 50 9900 9900
+
+        # A file-backed source: the position is a byte offset, so resuming seeks straight to it.
+        lines_path = os.path.join(directory, "lines.txt")
+        with open(lines_path, "w") as file:
+            file.write("\n".join(str(number) for number in range(100)))
+        path = os.path.join(directory, "lines.json")
+        with MmapIterator(lines_path) as lines:
+            run(CheckpointedIterator(lines, path, every_items=25), crash_after=60)
+        with MmapIterator(lines_path) as lines:
+            resumed = run(CheckpointedIterator(lines, path, every_items=25))
+        print(resumed.resumed_from, resumed.replayed, resumed.state["total"])
+        # Output:
+        # Simulated crash after item 60, last checkpoint at 50
+        # 140 0 4950
+
+        # Chunks of a buffer: the position is a chunk index.
+        path = os.path.join(directory, "chunks.json")
+        numbers = array("i", range(100))
+        chunks = CheckpointedIterator(SeekableChunks(numbers, 10), path, every_items=2)
+        for chunk in chunks:
+            if chunks.items == 5:
+                break  # Leaving the loop early; the `with` in `run` would save here too
+        chunks.checkpoint()
+        resumed = CheckpointedIterator(SeekableChunks(numbers, 10), path)
+        print(resumed.resumed_from, next(resumed).tolist())
+        # Output:
+        # 5 [50, 51, 52, 53, 54, 55, 56, 57, 58, 59]
+
+        # A checkpointed iterator is still just an iterator, so `process_collection` takes it unchanged.
+        sink = MemorySink()
+        process_collection(CheckpointedIterator(MyIterator("abc"), os.path.join(directory, "letters.json")), sink)
+        print(sink.getvalue().splitlines())
+        # Output:
+        # ['Processing item: a', 'Processing item: b', 'Processing item: c']
+
+    for label, nanoseconds in benchmark().items():
+        print(f"{label}: {nanoseconds:.0f} ns per item")
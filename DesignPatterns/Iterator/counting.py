@@ -0,0 +1,139 @@
+# Counting Filtered Items Without Iterating Over Them
+# ---------------------------------------------------
+# Example 3 in `more_itertools_iterator_examples.py` counts the numbers divisible by 3 with
+# `ilen(x for x in range(1000000) if x % 3 == 0)`. That creates and throws away 333,333 Python ints.
+# It is the right tool when all we have is an opaque generator, but often we know more:
+#
+# - If the input is a `range` and the filter is "x % divisor == remainder", the answer follows
+#   from arithmetic alone, so we can count a range of 10**12 numbers in constant time.
+# - If the input is numeric (a `range` or a NumPy array) and the predicate works on whole arrays
+#   (for example `lambda x: x % 7 < 3`), we can evaluate it one block of a million numbers at a time.
+#   NumPy arrays are evaluated this way automatically. A `range` is only turned into `int64` blocks
+#   when the caller passes `vectorized=True`: NumPy integers silently wrap around on overflow, so a
+#   predicate like `x * x % 7 == 1` gives wrong answers for large numbers, where Python ints do not.
+#   NumPy itself is only imported when a range is evaluated this way: it takes longer to import
+#   than everything else in this folder together, and an array can only exist once it is loaded.
+# - For everything else we keep using `ilen`, the generic fallback.
+
+import sys
+from math import gcd
+
+
+class Mod:
+    # A predicate that describes "x % divisor == remainder". It can be called like any other
+    # predicate (also on NumPy arrays), but `count` recognises it and answers ranges by arithmetic.
+    def __init__(self, divisor, remainder=0):
+        if divisor == 0:
+            raise ValueError("Divisor must not be zero")
+        self.divisor = divisor
+        self.remainder = remainder % divisor
+
+    def __call__(self, x):
+        return x % self.divisor == self.remainder
+
+    def __repr__(self):
+        return f"Mod({self.divisor}, {self.remainder})"
+
+
+def count(iterable, predicate=None, block_size=1 << 20, vectorized=False):
+    # Count the items of `iterable` for which `predicate` is true (all items if it is None),
+    # picking the cheapest strategy the input allows. Pass `vectorized=True` to promise that
+    # `predicate` gives the same answers on `int64` arrays as on Python ints for this range.
+    if isinstance(iterable, range):
+        if predicate is None:
+            return len(iterable)
+        if isinstance(predicate, Mod):
+            return _count_range_mod(iterable, predicate.divisor, predicate.remainder)
+
+    if predicate is not None and _is_numeric(iterable, vectorized):
+        total = _count_blocks(iterable, predicate, block_size)
+        if total is not None:
+            return total
+
+    # Only this fallback needs more_itertools, so it is imported on first use instead of with the module.
+    from more_itertools import ilen
+
+    if predicate is None:
+        return ilen(iterable)
+    return ilen(filter(predicate, iterable))
+
+
+def _count_range_mod(numbers, divisor, remainder):
+    # The k-th element of the range is start + k * step, for k in [0, len).
+    # We need (start + k * step) % divisor == remainder, i.e. k * step ≡ remainder - start (mod divisor).
+    # With g = gcd(step, divisor) this has solutions only if g divides (remainder - start), and then
+    # the solutions are k ≡ k0 (mod divisor // g). Counting those k in [0, len) is a single division.
+    length = len(numbers)
+    divisor = abs(divisor)
+    target = (remainder - numbers.start) % divisor
+    g = gcd(numbers.step, divisor)
+    if target % g:
+        return 0
+    period = divisor // g
+    k0 = (target // g) * pow(numbers.step // g, -1, period) % period if period > 1 else 0
+    if k0 >= length:
+        return 0
+    return (length - 1 - k0) // period + 1
+
+
+def _is_numeric(iterable, vectorized):
+    if isinstance(iterable, range):
+        return vectorized
+    # No need to import NumPy here: if it is not loaded yet, `iterable` cannot be an array.
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(iterable, np.ndarray) and iterable.dtype.kind in "iufb"
+
+
+def _count_blocks(iterable, predicate, block_size):
+    # Evaluates a vectorized predicate block by block, so memory use stays bounded no matter
+    # how long the input is. Returns None when the predicate cannot handle arrays, or when a range
+    # should be evaluated this way but NumPy is not installed.
+    try:
+        import numpy as np
+    except ImportError:  # NumPy is optional, the closed-form and `ilen` paths work without it.
+        return None
+    total = 0
+    length = len(iterable)
+    for start in range(0, length, block_size):
+        block = iterable[start : start + block_size]
+        if isinstance(block, range):
+            if not _fits_int64(block):
+                return None
+            block = np.arange(block.start, block.stop, block.step, dtype=np.int64)
+        try:
+            mask = np.asarray(predicate(block))
+        except (TypeError, ValueError):
+            # Typically "the truth value of an array is ambiguous": a scalar-only predicate.
+            return None
+        if mask.shape != block.shape:
+            return None
+        total += int(np.count_nonzero(mask))
+    return total
+
+
+def _fits_int64(numbers):
+    limit = 1 << 63
+    return -limit <= min(numbers.start, numbers.stop) and max(numbers.start, numbers.stop) < limit
+
+
+# Example usage of `count`:
+if __name__ == "__main__":
+    import time
+
+    # The same question as Example 3, answered by arithmetic instead of iteration.
+    print(f"count with Mod: {count(range(1000000), Mod(3))}")
+    # Output: count with Mod: 333334
+
+    start = time.perf_counter()
+    huge = count(range(10**12), Mod(7, 3))
+    print(f"range(10**12) with Mod(7, 3): {huge} in {(time.perf_counter() - start) * 1000:.3f} ms")
+
+    # An arbitrary predicate that works on arrays is evaluated in NumPy-sized blocks (if NumPy is installed).
+    print(f"count with vectorized predicate: {count(range(10**7), lambda x: x % 7 < 3, vectorized=True)}")
+
+    # Without `vectorized=True`, a range is counted with Python ints, which never overflow.
+    print(f"count of large squares: {count(range(4 * 10**9, 4 * 10**9 + 10**6), lambda x: x * x % 7 == 1)}")
+    # Output: count of large squares: 285714
+
+    # Anything else falls back to `ilen`.
+    print(f"count of a generator: {count(x for x in 'mississippi' if x == 's')}")
@@ -0,0 +1,194 @@
+# Iteration Benchmark Suite
+# -------------------------
+# `basic_iterator_vs_for_loop.py` discusses the trade-offs between a plain `for` loop and the custom
+# `MyIterator` class; this module measures them, together with generator functions, `chunked`, `ilen`
+# and the batched and vectorized variants from this folder.
+#
+# Every case walks the same numbers 0 .. n-1 and adds them up (or counts them), so the only difference
+# between the cases is the iteration machinery. For every case and input size we report:
+# - `ns_per_call`: the best wall-clock time over `--repeat` runs,
+# - `ns_per_item`: the same time divided by the number of items. It is null for the cases in
+#   `CONSTANT_TIME_CASES`, which answer by arithmetic without looking at the items, so their cost per
+#   item would only shrink with the input size and say nothing about iteration,
+# - `peak_bytes`: the peak memory allocated during one run, measured with `tracemalloc`.
+#
+# Run it from this folder:
+#     python -m iteration_benchmark --max-exponent 6 --output results.json
+# and compare the JSON files of two versions to spot regressions.
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from array import array
+
+from more_itertools import chunked, ilen
+
+if __package__:
+    from .basic_iterator_vs_for_loop import MyIterator
+    from .buffer_chunked import chunked_views
+    from .counting import Mod, count
+else:  # Run as a script from this folder
+    from basic_iterator_vs_for_loop import MyIterator
+    from buffer_chunked import chunked_views
+    from counting import Mod, count
+
+try:
+    import numpy as np
+except ImportError:  # The NumPy cases are skipped without it.
+    np = None
+
+BATCH_SIZE = 4096
+
+
+def _plain_loop(data):
+    total = 0
+    for item in data:
+        total += item
+    return total
+
+
+def _my_iterator(data):
+    total = 0
+    for item in MyIterator(data):
+        total += item
+    return total
+
+
+def _generator(data):
+    def items():
+        for item in data:
+            yield item
+
+    total = 0
+    for item in items():
+        total += item
+    return total
+
+
+def _chunked(data):
+    total = 0
+    for chunk in chunked(data, BATCH_SIZE):
+        total += sum(chunk)
+    return total
+
+
+def _my_iterator_batches(data):
+    total = 0
+    for batch in MyIterator(data).batches(BATCH_SIZE):
+        total += sum(batch)
+    return total
+
+
+def _ilen(data):
+    return ilen(iter(data))
+
+
+def _count_closed_form(data):
+    return count(range(len(data)), Mod(3))
+
+
+def _numpy_chunked_views(data):
+    total = 0
+    for chunk in chunked_views(data, BATCH_SIZE):
+        total += int(chunk.sum())
+    return total
+
+
+def _numpy_count(data):
+    return count(data, lambda x: x % 3 == 0)
+
+
+def _as_array(size):
+    return array("q", range(size))
+
+
+def _as_ndarray(size):
+    return np.arange(size, dtype=np.int64)
+
+
+# (name, how to build the input, what to run on it)
+CASES = [
+    ("plain_loop", _as_array, _plain_loop),
+    ("my_iterator", _as_array, _my_iterator),
+    ("generator", _as_array, _generator),
+    ("chunked", _as_array, _chunked),
+    ("my_iterator_batches", _as_array, _my_iterator_batches),
+    ("ilen", _as_array, _ilen),
+    ("count_closed_form", _as_array, _count_closed_form),
+]
+# Cases whose run time does not depend on the number of items; only `ns_per_call` is reported for them.
+CONSTANT_TIME_CASES = {"count_closed_form"}
+
+if np is not None:
+    CASES += [
+        ("numpy_chunked_views", _as_ndarray, _numpy_chunked_views),
+        ("numpy_count", _as_ndarray, _numpy_count),
+    ]
+
+
+def measure(run, data, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        run(data)
+        best = min(best, time.perf_counter_ns() - start)
+
+    # Memory is measured in a separate run, because tracing slows everything down.
+    tracemalloc.start()
+    try:
+        run(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run_suite(sizes, repeat=3, cases=None):
+    results = []
+    for name, setup, run in CASES:
+        if cases and name not in cases:
+            continue
+        for size in sizes:
+            data = setup(size)
+            best, peak = measure(run, data, repeat)
+            results.append(
+                {
+                    "case": name,
+                    "size": size,
+                    "ns_per_call": best,
+                    "ns_per_item": None if name in CONSTANT_TIME_CASES else best / size,
+                    "peak_bytes": peak,
+                }
+            )
+            del data
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the iteration examples in this folder.")
+    parser.add_argument("--min-exponent", type=int, default=3, help="smallest input size as a power of ten")
+    parser.add_argument("--max-exponent", type=int, default=6, help="largest input size as a power of ten (up to 8)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case, the best one is reported")
+    parser.add_argument("--case", action="append", help="only run this case (can be given several times)")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    sizes = [10**exponent for exponent in range(args.min_exponent, args.max_exponent + 1)]
+    report = run_suite(sizes, args.repeat, args.case)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# Memory-Mapped File Iterator
+# ---------------------------
+# `MyIterator` walks over a collection that already lives in memory. For a file that is
+# far larger than RAM, loading it into a list first is not an option. `mmap` lets the
+# operating system map the file into our address space and page it in on demand, so we can
+# iterate over it as if it were one big `bytes` object without ever reading it all at once.
+#
+# `MmapIterator` is a sibling of `MyIterator`: it keeps its position in `self.index`
+# (a byte offset here) and implements `__iter__` / `__next__`, so anything that accepts an
+# iterable, including `process_collection`, can consume it unchanged.
+
+import mmap
+import os
+
+if __package__:
+    from .basic_iterator_vs_for_loop import process_collection
+else:  # Run as a script from this folder
+    from basic_iterator_vs_for_loop import process_collection
+
+
+class MmapIterator:
+    def __init__(self, path, record_size=None, offset=0, advice=None, read_ahead=0):
+        # `record_size` selects fixed-width records; without it the file is split into
+        # newline-delimited lines (the newline itself is not part of the yielded line).
+        # `offset` is the byte position to start from. In line mode it should point at
+        # the start of a line.
+        # `advice` is an optional `mmap.MADV_*` constant applied to the whole mapping,
+        # e.g. `mmap.MADV_SEQUENTIAL` to ask the kernel for aggressive read-ahead.
+        # `read_ahead` is a number of bytes to hint with `MADV_WILLNEED` just ahead of
+        # the current position while iterating.
+        if record_size is not None and record_size < 1:
+            raise ValueError("Record size must be at least 1")
+        if offset < 0:
+            raise ValueError("Offset must not be negative")
+        self.record_size = record_size
+        self.index = offset
+        self.read_ahead = read_ahead
+        self._hinted_until = offset
+
+        with open(path, "rb") as file:
+            self.size = os.fstat(file.fileno()).st_size
+            # An empty file cannot be mapped, so there is simply nothing to iterate over.
+            # The mapping keeps its own reference to the file, so we can close ours right away.
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+
+        if self._mmap is not None and advice is not None and hasattr(self._mmap, "madvise"):
+            self._mmap.madvise(advice)
+        # Slicing a memoryview of the mapping gives us records that point straight into
+        # the page cache. Nothing is copied until the consumer asks for `bytes(record)`.
+        self._view = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = self.index
+        if start >= self.size:
+            raise StopIteration
+        if start >= self._hinted_until and self.read_ahead:
+            self._hint(start)
+
+        if self.record_size is not None:
+            end = start + self.record_size
+            if end > self.size:
+                # A trailing partial record is not a complete record, so it is not yielded.
+                raise StopIteration
+            self.index = end
+            return self._view[start:end]
+
+        end = self._mmap.find(b"\n", start)
+        if end == -1:
+            # The last line of a file does not always end with a newline.
+            end = self.size
+        self.index = end + 1
+        return self._view[start:end]
+
+    def tell(self):
+        # The byte offset of the next record, which can be passed back as `offset` or to `seek`.
+        return self.index
+
+    def seek(self, offset):
+        # Jumps to a byte offset without reading anything before it. In line mode the offset
+        # should be one returned by `tell`, so that it points at the start of a line.
+        if offset < 0:
+            raise ValueError("Offset must not be negative")
+        self.index = offset
+        self._hinted_until = offset
+
+    def __length_hint__(self):
+        # Only fixed-width records let us know the remaining count up front.
+        if self.record_size is None:
+            return NotImplemented
+        return max(self.size - self.index, 0) // self.record_size
+
+    def _hint(self, start):
+        # `madvise` needs a page-aligned start, so we round down to the page boundary.
+        aligned = start - start % mmap.PAGESIZE
+        length = min(self.read_ahead + (start - aligned), self.size - aligned)
+        if hasattr(self._mmap, "madvise"):
+            self._mmap.madvise(mmap.MADV_WILLNEED, aligned, length)
+        self._hinted_until = aligned + length
+
+    def close(self):
+        # The records we handed out are views into the mapping. They must be released
+        # (or garbage collected) before the mapping can be closed, otherwise `BufferError` is raised.
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# Example usage of the memory-mapped iterator:
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Fixed-width records: every record is exactly 8 bytes long.
+        records_path = os.path.join(directory, "records.bin")
+        with open(records_path, "wb") as file:
+            file.write(b"".join(f"rec{i:05d}".encode() for i in range(4)))
+
+        with MmapIterator(records_path, record_size=8, advice=getattr(mmap, "MADV_SEQUENTIAL", None)) as records:
+            # `bytes()` copies a record only because we want to print it.
+            process_collection(map(bytes, records))
+
+        # Newline-delimited lines, starting from the second line (byte offset 6).
+        lines_path = os.path.join(directory, "lines.txt")
+        with open(lines_path, "wb") as file:
+            file.write(b"alpha\nbravo\ncharlie\ndelta")
+
+        with MmapIterator(lines_path, offset=6, read_ahead=1 << 20) as lines:
+            process_collection(map(bytes, lines))
+
+# Output:
+# Processing item: b'rec00000'
+# Processing item: b'rec00001'
+# Processing item: b'rec00002'
+# Processing item: b'rec00003'
+# Processing item: b'bravo'
+# Processing item: b'charlie'
+# Processing item: b'delta'
@@ -5,19 +5,23 @@
 
 from more_itertools import chunked, distinct_permutations, ilen
 
+# The examples only run when this file is executed directly, so importing it does not
+# print anything or count a million numbers.
+
 # Example 1: Using `chunked` to break data into smaller pieces
 # ------------------------------------------------------------
 # Imagine you have a long list of numbers, and you want to break it down into smaller parts,
 # like slicing a loaf of bread into pieces. The `chunked` function from more_itertools helps you do this.
 # It creates an iterator that yields chunks (sub-lists) of a specified size from the original list.
 
-# Here, we create an iterator that yields chunks of 3 elements each from a range of numbers from 0 to 9.
-chunks = chunked(range(10), 3)
+if __name__ == "__main__":
+    # Here, we create an iterator that yields chunks of 3 elements each from a range of numbers from 0 to 9.
+    chunks = chunked(range(10), 3)
 
-# We can now iterate over these chunks using a `for` loop.
-# The loop will print each chunk (sub-list) one by one.
-for chunk in chunks:
-    print(chunk)
+    # We can now iterate over these chunks using a `for` loop.
+    # The loop will print each chunk (sub-list) one by one.
+    for chunk in chunks:
+        print(chunk)
 
 # Output Explanation:
 # The output will be:
@@ -38,12 +42,13 @@ for chunk in chunks:
 # You want to see all the different ways you can arrange these cards. The `distinct_permutations` function is like
 # a helper that shuffles the cards and shows you each unique arrangement.
 
-# We create an iterator for the distinct permutations of the list [1, 2, 1].
-perms = distinct_permutations([1, 2, 1])
+if __name__ == "__main__":
+    # We create an iterator for the distinct permutations of the list [1, 2, 1].
+    perms = distinct_permutations([1, 2, 1])
 
-# We then iterate over these permutations and print each one.
-for perm in perms:
-    print(perm)
+    # We then iterate over these permutations and print each one.
+    for perm in perms:
+        print(perm)
 
 # Output Explanation:
 # The output will include all unique permutations of the list [1, 2, 1]:
@@ -59,15 +64,16 @@ for perm in perms:
 # Finally, let’s consider a situation where you need to count specific items within a large dataset.
 # For instance, imagine you want to count how many numbers between 1 and 1,000,000 are divisible by 3.
 
-# We create a generator expression that yields numbers divisible by 3.
-gen = (x for x in range(1000000) if x % 3 == 0)
+if __name__ == "__main__":
+    # We create a generator expression that yields numbers divisible by 3.
+    gen = (x for x in range(1000000) if x % 3 == 0)
 
-# To count how many such numbers there are, we use the `ilen` function from more_itertools.
-# `ilen` efficiently counts the number of items produced by the generator.
-count = ilen(gen)
+    # To count how many such numbers there are, we use the `ilen` function from more_itertools.
+    # `ilen` efficiently counts the number of items produced by the generator.
+    count = ilen(gen)
 
-# Print the count of numbers divisible by 3.
-print(f"gen count ilen: {count}")
+    # Print the count of numbers divisible by 3.
+    print(f"gen count ilen: {count}")
 
 # Output Explanation:
 # The output will be:
@@ -0,0 +1,141 @@
+# Counting, Ranking and Sharding Distinct Permutations
+# ----------------------------------------------------
+# Example 2 in `more_itertools_iterator_examples.py` walks `distinct_permutations([1, 2, 1])`
+# from the first arrangement to the last. For sortable items, `distinct_permutations` produces
+# the arrangements in sorted (lexicographic) order, which means every arrangement has a fixed
+# position in that sequence, its rank. Once we can convert between an arrangement and its rank we can:
+#
+# - count the arrangements without generating them (the multinomial coefficient n! / (c1! * c2! * ...)),
+# - jump straight to the arrangement at any position (unrank),
+# - generate just the arrangements in positions [start, stop), and therefore
+# - split the whole output into contiguous shards that worker processes generate in parallel.
+#
+# The items must be sortable; the output then matches `distinct_permutations` exactly.
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from math import factorial
+
+
+def _multiset(items):
+    # The distinct values in sorted order, and how many times each of them occurs.
+    counter = Counter(items)
+    values = sorted(counter)
+    return values, [counter[value] for value in values]
+
+
+def count_distinct_permutations(items):
+    values, counts = _multiset(items)
+    total = factorial(sum(counts))
+    for count in counts:
+        total //= factorial(count)
+    return total
+
+
+def rank_permutation(permutation):
+    # The position of `permutation` among the distinct permutations of its own items.
+    # At each position, every smaller value we could have placed there instead accounts for
+    # all arrangements of the remaining items that start with it.
+    values, counts = _multiset(permutation)
+    position_of = {value: index for index, value in enumerate(values)}
+    remaining = len(permutation)
+    total = count_distinct_permutations(permutation)
+    rank = 0
+    for item in permutation:
+        code = position_of[item]
+        for smaller in range(code):
+            if counts[smaller]:
+                # Arrangements that start with `values[smaller]`: total * c / n.
+                rank += total * counts[smaller] // remaining
+        total = total * counts[code] // remaining
+        counts[code] -= 1
+        remaining -= 1
+    return rank
+
+
+def unrank_permutation(items, rank):
+    # The inverse of `rank_permutation`: the distinct permutation of `items` at position `rank`.
+    values, counts = _multiset(items)
+    remaining = sum(counts)
+    total = count_distinct_permutations(items)
+    if not 0 <= rank < total:
+        raise IndexError(f"Rank {rank} is out of range for {total} distinct permutations")
+    permutation = []
+    for _ in range(remaining):
+        for code, count in enumerate(counts):
+            if not count:
+                continue
+            block = total * count // remaining
+            if rank < block:
+                permutation.append(values[code])
+                counts[code] -= 1
+                total = block
+                remaining -= 1
+                break
+            rank -= block
+    return tuple(permutation)
+
+
+def permutations_range(items, start, stop=None):
+    # Yields the distinct permutations with ranks in [start, stop), in the same order as
+    # `distinct_permutations`. Only the first one is computed by unranking, the rest are
+    # produced by the usual "next lexicographic permutation" step.
+    total = count_distinct_permutations(items)
+    stop = total if stop is None else min(stop, total)
+    if start >= stop:
+        return
+    current = list(unrank_permutation(items, start))
+    size = len(current)
+    for _ in range(stop - start - 1):
+        yield tuple(current)
+        # Find the last position i where current[i] < current[i + 1] ...
+        for i in range(size - 2, -1, -1):
+            if current[i] < current[i + 1]:
+                break
+        # ... swap it with the last larger item after it, then reverse the tail.
+        for j in range(size - 1, i, -1):
+            if current[i] < current[j]:
+                break
+        current[i], current[j] = current[j], current[i]
+        current[i + 1 :] = current[: i - size : -1]
+    yield tuple(current)
+
+
+def _permutations_shard(items, start, stop):
+    # Runs in a worker process. It returns a list because results have to be pickled back anyway.
+    return list(permutations_range(items, start, stop))
+
+
+def parallel_distinct_permutations(items, workers=None, shards=None):
+    # Splits the rank space into contiguous shards, generates them in a process pool and yields
+    # the permutations in their original order (`Executor.map` returns results in submission order).
+    items = tuple(items)
+    total = count_distinct_permutations(items)
+    if shards is None:
+        shards = 4 * (workers or 4)
+    shards = max(1, min(shards, total))
+    bounds = [total * shard // shards for shard in range(shards + 1)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for permutations in executor.map(_permutations_shard, repeat(items), bounds[:-1], bounds[1:]):
+            yield from permutations
+
+
+# Example usage:
+if __name__ == "__main__":
+    from more_itertools import distinct_permutations
+
+    cards = [1, 2, 1]
+    print(count_distinct_permutations(cards))  # Output: 3
+    print(unrank_permutation(cards, 1))  # Output: (1, 2, 1)
+    print(rank_permutation((2, 1, 1)))  # Output: 2
+
+    # Skip straight to the middle of a large output space.
+    word = "mississippi"
+    total = count_distinct_permutations(word)
+    print(total, "".join(unrank_permutation(word, total // 2)))  # Output: 34650 pisimsspisi
+
+    # The sharded, parallel output is identical to `distinct_permutations`.
+    assert list(parallel_distinct_permutations(word, workers=4)) == list(distinct_permutations(word))
+    assert all(rank_permutation(p) == rank for rank, p in enumerate(distinct_permutations(word)))
+    print("parallel output matches distinct_permutations")
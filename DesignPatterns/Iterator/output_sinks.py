@@ -0,0 +1,132 @@
+# Buffered Output Sinks
+# ---------------------
+# `process_collection` prints one line per item. Each `print` call formats the line, looks up
+# `sys.stdout`, writes, and (on a terminal or a line-buffered stream) flushes. For a few items
+# that is nothing, but for millions of items the per-call overhead is most of the work.
+#
+# A sink collects the formatted lines in a list and writes them to the underlying stream in
+# one large block once `flush_size` characters have accumulated (or `flush_interval` seconds
+# have passed since the last write). Pass a sink to `process_collection(collection, sink)`.
+
+import io
+import sys
+import time
+
+if __package__:
+    from .basic_iterator_vs_for_loop import process_collection
+else:  # Run as a script from this folder
+    from basic_iterator_vs_for_loop import process_collection
+
+
+class BufferedSink:
+    def __init__(self, stream, flush_size=1 << 16, flush_interval=None):
+        # `flush_size` is the number of buffered characters that triggers a write.
+        # `flush_interval` (seconds) bounds how long a line may wait in the buffer,
+        # which is useful when a slow producer trickles items in.
+        if flush_size < 1:
+            raise ValueError("Flush size must be at least 1")
+        self.stream = stream
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, text):
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.flush_size:
+            self.flush()
+        elif self.flush_interval is not None and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        # One `write` call for the whole block, followed by a single flush of the stream.
+        if self._buffer:
+            self._stream().write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        self._stream().flush()
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+
+    def _stream(self):
+        return self.stream
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class StdoutSink(BufferedSink):
+    def __init__(self, flush_size=1 << 16, flush_interval=None):
+        super().__init__(None, flush_size, flush_interval)
+
+    def _stream(self):
+        # Looked up on every flush, like `print` does, so redirecting `sys.stdout` keeps working.
+        return sys.stdout
+
+
+class FileSink(BufferedSink):
+    def __init__(self, path, flush_size=1 << 16, flush_interval=None, encoding="utf-8"):
+        super().__init__(open(path, "w", encoding=encoding), flush_size, flush_interval)
+
+    def close(self):
+        super().close()
+        self.stream.close()
+
+
+class MemorySink(BufferedSink):
+    def __init__(self, flush_size=1 << 16, flush_interval=None):
+        super().__init__(io.StringIO(), flush_size, flush_interval)
+
+    def getvalue(self):
+        self.flush()
+        return self.stream.getvalue()
+
+
+# Benchmark: per-item `print` versus a buffered sink
+# --------------------------------------------------
+# Both paths write to the same kind of line-buffered file, which behaves like a terminal:
+# every newline written through `print` triggers a flush.
+def benchmark(item_count=1_000_000, flush_size=1 << 16):
+    import contextlib
+    import os
+    import tempfile
+
+    items = range(item_count)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "out.txt")
+
+        with open(path, "w", buffering=1) as stream, contextlib.redirect_stdout(stream):
+            start = time.perf_counter()
+            process_collection(items)
+            results["print"] = item_count / (time.perf_counter() - start)
+
+        with open(path, "w", buffering=1) as stream:
+            sink = BufferedSink(stream, flush_size=flush_size)
+            start = time.perf_counter()
+            process_collection(items, sink)
+            results["sink"] = item_count / (time.perf_counter() - start)
+
+    return results
+
+
+# Example usage of the sinks:
+if __name__ == "__main__":
+    # Writes to standard output in blocks of 64 KiB.
+    with StdoutSink() as sink:
+        process_collection([1, 2, 3, 4], sink)
+
+    # Keeps the output in memory, e.g. for tests.
+    memory_sink = MemorySink()
+    process_collection("abc", memory_sink)
+    print(memory_sink.getvalue().splitlines())
+
+    for path_name, items_per_second in benchmark().items():
+        print(f"{path_name:>5}: {items_per_second:,.0f} items/sec")
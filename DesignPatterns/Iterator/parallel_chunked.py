@@ -0,0 +1,80 @@
+# Processing `chunked` Batches in Parallel
+# ----------------------------------------
+# Example 1 in `more_itertools_iterator_examples.py` breaks data into chunks, and a typical pipeline
+# then processes the chunks one after another on a single core. `parallel_map_chunks` keeps the same
+# chunk-then-process shape, but hands every chunk to a worker pool:
+#
+# - a process pool for CPU-bound work (the function and the chunks must be picklable),
+#   or a thread pool for I/O-bound work,
+# - at most `prefetch` chunks are in flight at any time, so a huge (or endless) input is
+#   never pulled into memory all at once,
+# - results come back as a generator, in the same order as the input chunks,
+#   together with the time each chunk took inside its worker.
+
+import os
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from more_itertools import chunked
+
+ChunkResult = namedtuple("ChunkResult", ["index", "result", "elapsed"])
+
+_EXECUTORS = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+
+
+def _timed_call(func, chunk):
+    # Runs inside the worker, so `elapsed` measures the work itself, not the time spent waiting in the queue.
+    start = time.perf_counter()
+    result = func(chunk)
+    return result, time.perf_counter() - start
+
+
+def parallel_map_chunks(func, iterable, chunk_size=1000, workers=None, prefetch=None, executor="process"):
+    # Yields a `ChunkResult(index, result, elapsed)` for every chunk, where `result` is `func(chunk)`.
+    if executor not in _EXECUTORS:
+        raise ValueError(f"Executor must be one of {sorted(_EXECUTORS)}, not {executor!r}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Worker count must be at least 1")
+    # By default every worker has one chunk running and one waiting, which keeps them busy
+    # while we hand results back to the consumer. An explicit 0 is an error, not the default.
+    if prefetch is None:
+        prefetch = 2 * workers
+    if prefetch < 1:
+        raise ValueError("Prefetch depth must be at least 1")
+
+    with _EXECUTORS[executor](max_workers=workers) as pool:
+        pending = deque()
+        try:
+            for index, chunk in enumerate(chunked(iterable, chunk_size)):
+                pending.append((index, pool.submit(_timed_call, func, chunk)))
+                if len(pending) >= prefetch:
+                    # The oldest chunk is the next one the consumer needs, so we wait for it first.
+                    yield _result(*pending.popleft())
+            while pending:
+                yield _result(*pending.popleft())
+        finally:
+            # If the consumer stops early, chunks that have not started yet are not worth running.
+            for _, future in pending:
+                future.cancel()
+
+
+def _result(index, future):
+    result, elapsed = future.result()
+    return ChunkResult(index, result, elapsed)
+
+
+def _sum_of_squares(chunk):
+    return sum(x * x for x in chunk)
+
+
+# Example usage:
+if __name__ == "__main__":
+    total = 0
+    for chunk_result in parallel_map_chunks(_sum_of_squares, range(2_000_000), chunk_size=250_000, workers=4):
+        total += chunk_result.result
+        print(f"chunk {chunk_result.index}: {chunk_result.elapsed * 1000:.1f} ms")
+    print(f"total: {total}")
+    assert total == sum(x * x for x in range(2_000_000))
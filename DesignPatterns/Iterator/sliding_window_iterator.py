@@ -0,0 +1,303 @@
+# Sliding Windows With Running Aggregates
+# ---------------------------------------
+# `more_itertools.chunked` cuts a stream into separate chunks. For rolling sums, means, minimums and
+# maximums we need overlapping windows instead: [1, 2, 3], [2, 3, 4], [3, 4, 5], ...
+# Building every window as a fresh slice and calling `sum`, `min` and `max` on it costs O(window)
+# per step, which adds up quickly for large windows over long streams.
+#
+# `SlidingWindow` does the same work in amortised O(1) per element:
+# - The last `n` items live in a fixed-size ring buffer: every step overwrites the oldest slot, and
+#   the window is yielded as a read-only `WindowView` over that buffer, so no window is ever copied.
+# - The running sum adds the new item and subtracts the one that dropped out; the mean follows from it.
+# - Minimum and maximum use monotonic deques: the min deque only keeps items that are smaller than
+#   everything after them (the max deque the mirror image), so its first entry is the window minimum.
+#   Every item is added and removed at most once.
+#
+# For numeric data that is already in (or can be collected into) a NumPy array, the batch functions
+# compute the aggregates of all windows at once: `rolling_sum` from one cumulative sum, and
+# `rolling_min`/`rolling_max` with the van Herk/Gil-Werman algorithm (running minimums within blocks
+# of `n`, from both ends). `rolling_stream` applies them to a long stream, one block at a time.
+# NumPy takes longer to import than everything else in this folder together, so it is imported by
+# the first call of a batch function instead of with the module.
+
+import math
+import time
+from collections import deque, namedtuple
+from itertools import chain, islice
+
+
+class WindowView:
+    # A read-only view of the current window, oldest item first. The view belongs to its
+    # SlidingWindow and shows the new window after every step; use `tolist()` to keep a copy.
+    __slots__ = ("_window",)
+
+    def __init__(self, window):
+        self._window = window
+
+    def __len__(self):
+        return self._window.n
+
+    def __getitem__(self, index):
+        window = self._window
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        if not -window.n <= index < window.n:
+            raise IndexError("Window index out of range")
+        return window._buffer[(window._start + index) % window.n]
+
+    def __iter__(self):
+        window = self._window
+        buffer = window._buffer
+        return chain(islice(buffer, window._start, None), islice(buffer, window._start))
+
+    def tolist(self):
+        window = self._window
+        return window._buffer[window._start :] + window._buffer[: window._start]
+
+    def __repr__(self):
+        return f"WindowView({self.tolist()})"
+
+
+class SlidingWindow:
+    def __init__(self, iterable, n, aggregates=True):
+        if n < 1:
+            raise ValueError("Window size must be at least 1")
+        self._iterator = iter(iterable)
+        self.n = n
+        self.aggregates = aggregates  # Turn off for items that are not numbers
+        self._buffer = [None] * n
+        self._start = 0  # Slot of the oldest item in the window
+        self._seen = 0
+        self.sum = 0
+        self._mins = deque()  # (position, value) pairs with increasing values
+        self._maxs = deque()  # (position, value) pairs with decreasing values
+        self._view = WindowView(self)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        # The first window needs `n` items, every following window one more.
+        push = self._push
+        while True:
+            value = next(self._iterator)
+            push(value)
+            if self._seen >= self.n:
+                return self._view
+
+    def _push(self, value):
+        n = self.n
+        position = self._seen
+        slot = position % n
+        buffer = self._buffer
+        if self.aggregates:
+            if position >= n:
+                self.sum -= buffer[slot]
+            self.sum += value
+
+            mins = self._mins
+            while mins and mins[-1][1] >= value:
+                mins.pop()
+            mins.append((position, value))
+            if mins[0][0] <= position - n:
+                mins.popleft()
+
+            maxs = self._maxs
+            while maxs and maxs[-1][1] <= value:
+                maxs.pop()
+            maxs.append((position, value))
+            if maxs[0][0] <= position - n:
+                maxs.popleft()
+
+            # Adding and subtracting floats accumulates rounding errors, so once per `n` steps we
+            # recompute the sum exactly. That is O(n) every n steps, still O(1) per element.
+            if slot == n - 1 and isinstance(self.sum, float):
+                buffer[slot] = value
+                self.sum = math.fsum(buffer)
+        buffer[slot] = value
+        self._seen = position + 1
+        self._start = (slot + 1) % n
+
+    @property
+    def mean(self):
+        return self.sum / self.n
+
+    @property
+    def min(self):
+        return self._mins[0][1]
+
+    @property
+    def max(self):
+        return self._maxs[0][1]
+
+
+RollingBlock = namedtuple("RollingBlock", ["sum", "mean", "min", "max"])
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional, `SlidingWindow` works without it.
+        raise RuntimeError("The batch functions need NumPy") from None
+    return numpy
+
+
+def _as_windowable(values, n):
+    np = _numpy()
+    if n < 1:
+        raise ValueError("Window size must be at least 1")
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError("Expected a one-dimensional array")
+    return values
+
+
+def rolling_sum(values, n):
+    np = _numpy()
+    values = _as_windowable(values, n)
+    if len(values) < n:
+        return values[:0].astype(np.result_type(values, np.int64))
+    # The sum of values[i:i + n] is the difference of two cumulative sums.
+    totals = np.concatenate(([0], np.cumsum(values)))
+    return totals[n:] - totals[:-n]
+
+
+def rolling_mean(values, n):
+    return rolling_sum(values, n) / n
+
+
+def _rolling_extreme(values, n, ufunc):
+    values = _as_windowable(values, n)
+    length = len(values)
+    if length < n:
+        return values[:0]
+    # Van Herk/Gil-Werman: split the data into blocks of `n`. Every window covers the end of one
+    # block and the start of the next, so its extreme is the extreme of a suffix of the first block
+    # and a prefix of the second. Prefix and suffix extremes of all blocks take two passes.
+    blocks = -(-length // n)
+    padded = _numpy().pad(values, (0, blocks * n - length), mode="edge").reshape(blocks, n)
+    prefix = ufunc.accumulate(padded, axis=1).ravel()
+    suffix = ufunc.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    return ufunc(suffix[: length - n + 1], prefix[n - 1 : length])
+
+
+def rolling_min(values, n):
+    return _rolling_extreme(values, n, _numpy().minimum)
+
+
+def rolling_max(values, n):
+    return _rolling_extreme(values, n, _numpy().maximum)
+
+
+def rolling_stream(iterable, n, block_size=1 << 16, dtype=float):
+    # Collects the stream into arrays of `block_size` numbers and yields a RollingBlock with the
+    # aggregates of every window that ends in that block. The last `n - 1` numbers of each block
+    # are carried over, because the first windows of the next block start there.
+    np = _numpy()
+    _as_windowable([], n)
+    iterator = iter(iterable)
+    carried = np.empty(0, dtype=dtype)
+    while True:
+        block = np.fromiter(islice(iterator, block_size), dtype=dtype)
+        if not len(block):
+            return
+        data = np.concatenate((carried, block))
+        if len(data) >= n:
+            sums = rolling_sum(data, n)
+            yield RollingBlock(sums, sums / n, rolling_min(data, n), rolling_max(data, n))
+        carried = data[len(data) - n + 1 :] if n > 1 else data[:0]
+
+
+def benchmark(windows=(10, 100, 1_000, 10_000, 100_000), steps=100_000, naive_steps=200):
+    # Nanoseconds per window for the sum, mean, min and max of every window. Naive slicing is
+    # timed on the first `naive_steps` windows only, because it gets very slow for large windows.
+    # The other two include filling the first window, which shows for windows close to `steps`.
+    import random
+
+    generator = random.Random(0)
+    data = [generator.random() for _ in range(max(windows) + steps - 1)]
+    try:
+        array = _numpy().array(data)
+    except RuntimeError:
+        array = None
+    results = []
+    for n in windows:
+        items = data[: n + steps - 1]
+        result = {"window": n}
+
+        start = time.perf_counter()
+        for position in range(naive_steps):
+            window = items[position : position + n]
+            total = sum(window)
+            total / n, min(window), max(window)
+        result["naive_ns"] = (time.perf_counter() - start) / naive_steps * 1e9
+
+        start = time.perf_counter()
+        sliding = SlidingWindow(items, n)
+        for _ in sliding:
+            sliding.sum, sliding.mean, sliding.min, sliding.max
+        result["ring_ns"] = (time.perf_counter() - start) / steps * 1e9
+
+        if array is not None:
+            values = array[: n + steps - 1]
+            start = time.perf_counter()
+            sums = rolling_sum(values, n)
+            sums / n, rolling_min(values, n), rolling_max(values, n)
+            result["numpy_ns"] = (time.perf_counter() - start) / steps * 1e9
+        results.append(result)
+    return results
+
+
+# Example usage of `SlidingWindow`:
+if __name__ == "__main__":
+    sliding = SlidingWindow([4, 1, 3, 5, 2, 6], 3)
+    for window in sliding:
+        print(window.tolist(), sliding.sum, sliding.min, sliding.max)
+    # Output:
+    # [4, 1, 3] 8 1 4
+    # [1, 3, 5] 9 1 5
+    # [3, 5, 2] 10 2 5
+    # [5, 2, 6] 13 2 6
+
+    # The views are read-only and never copied: every step shows the next window.
+    sliding = SlidingWindow("abcde", 2, aggregates=False)
+    view = next(sliding)
+    print(view)
+    print(next(sliding) is view, view)
+    # Output:
+    # WindowView(['a', 'b'])
+    # True WindowView(['b', 'c'])
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        values = np.array([4, 1, 3, 5, 2, 6])
+        print(rolling_sum(values, 3), rolling_min(values, 3), rolling_max(values, 3))
+        # Output:
+        # [ 8  9 10 13] [1 1 2 2] [4 5 5 6]
+
+        blocks = list(rolling_stream(range(10), 4, block_size=3))
+        print(np.concatenate([block.mean for block in blocks]))
+        # Output:
+        # [1.5 2.5 3.5 4.5 5.5 6.5 7.5]
+
+        # The batch functions and the ring buffer agree with naive slicing.
+        generator = np.random.default_rng(0)
+        numbers = generator.integers(-1000, 1000, 5000)
+        for n in (1, 7, 64, 5000):
+            naive = [numbers[i : i + n] for i in range(len(numbers) - n + 1)]
+            sliding = SlidingWindow(numbers.tolist(), n)
+            ring = [(sliding.sum, sliding.min, sliding.max) for _ in sliding]
+            assert ring == [(window.sum(), window.min(), window.max()) for window in naive]
+            assert rolling_sum(numbers, n).tolist() == [window.sum() for window in naive]
+            assert rolling_min(numbers, n).tolist() == [window.min() for window in naive]
+            assert rolling_max(numbers, n).tolist() == [window.max() for window in naive]
+        print("Ring buffer and batch aggregates match naive slicing")
+
+    for result in benchmark():
+        numpy_ns = f"{result['numpy_ns']:,.0f}" if "numpy_ns" in result else "n/a"
+        print(f"window {result['window']:>7,}: naive {result['naive_ns']:>12,.0f} ns, "
+              f"ring buffer {result['ring_ns']:>6,.0f} ns, numpy {numpy_ns:>4} ns per window")
@@ -61,12 +61,13 @@ class Cat(Animal):
         return "Meow!"
 
 
-# Creating instances of each class
-generic_animal = Animal()
-dog = Dog()
-cat = Cat()
-
-# Demonstrating the use of the speak method in each class
-print("Animal says:", generic_animal.speak())  # Output: Some generic animal sound
-print("Dog says:", dog.speak())  # Output: Woof!
-print("Cat says:", cat.speak())  # Output: Meow!
+if __name__ == "__main__":
+    # Creating instances of each class
+    generic_animal = Animal()
+    dog = Dog()
+    cat = Cat()
+
+    # Demonstrating the use of the speak method in each class
+    print("Animal says:", generic_animal.speak())  # Output: Some generic animal sound
+    print("Dog says:", dog.speak())  # Output: Woof!
+    print("Cat says:", cat.speak())  # Output: Meow!
@@ -41,11 +41,12 @@ class Car:
         return self.engine.start()
 
 
-# Creating an instance of Engine
-engine = Engine()
+if __name__ == "__main__":
+    # Creating an instance of Engine
+    engine = Engine()
 
-# Creating an instance of Car with the Engine instance
-car = Car(engine)
+    # Creating an instance of Car with the Engine instance
+    car = Car(engine)
 
-# Demonstrating the use of the start method in Car, which delegates to Engine
-print(car.start())  # Output: Engine starts
+    # Demonstrating the use of the start method in Car, which delegates to Engine
+    print(car.start())  # Output: Engine starts
@@ -39,11 +39,12 @@ class FileHandler(LogMixin):
         print(f"File {filename} opened successfully")
 
 
-# Creating an instance of FileHandler
-file_handler = FileHandler()
-
-# Demonstrating the use of the open_file method, which uses the log method from LogMixin
-file_handler.open_file("example.txt")
-# Output:
-# Log: Opening file: example.txt
-# File example.txt opened successfully
+if __name__ == "__main__":
+    # Creating an instance of FileHandler
+    file_handler = FileHandler()
+
+    # Demonstrating the use of the open_file method, which uses the log method from LogMixin
+    file_handler.open_file("example.txt")
+    # Output:
+    # Log: Opening file: example.txt
+    # File example.txt opened successfully
@@ -66,13 +66,14 @@ class Dog(Animal):
         return "Running on four legs"
 
 
-# Demonstrating regular inheritance
-generic_animal = Animal()
-dog = Dog()
+if __name__ == "__main__":
+    # Demonstrating regular inheritance
+    generic_animal = Animal()
+    dog = Dog()
 
-# Calling the move method on both the generic animal and the dog
-print(f"Animal moves: {generic_animal.move()}")  # Output: Moving around
-print(f"Dog moves: {dog.move()}")  # Output: Running on four legs
+    # Calling the move method on both the generic animal and the dog
+    print(f"Animal moves: {generic_animal.move()}")  # Output: Moving around
+    print(f"Dog moves: {dog.move()}")  # Output: Running on four legs
 
 
 # --- Mixin Example ---
@@ -122,18 +123,19 @@ class NetworkHandler(LogMixin):
         print(f"Connected to {address}")
 
 
-# Demonstrating mixin usage with both FileHandler and NetworkHandler
+if __name__ == "__main__":
+    # Demonstrating mixin usage with both FileHandler and NetworkHandler
 
-# Creating an instance of FileHandler
-file_handler = FileHandler()
-file_handler.open_file("example.txt")
-# Output:
-# Log: Opening file: example.txt
-# File example.txt opened successfully
+    # Creating an instance of FileHandler
+    file_handler = FileHandler()
+    file_handler.open_file("example.txt")
+    # Output:
+    # Log: Opening file: example.txt
+    # File example.txt opened successfully
 
-# Creating an instance of NetworkHandler
-network_handler = NetworkHandler()
-network_handler.connect("192.168.1.1")
-# Output:
-# Log: Connecting to 192.168.1.1
-# Connected to 192.168.1.1
+    # Creating an instance of NetworkHandler
+    network_handler = NetworkHandler()
+    network_handler.connect("192.168.1.1")
+    # Output:
+    # Log: Connecting to 192.168.1.1
+    # Connected to 192.168.1.1
@@ -59,15 +59,16 @@ class DataHandler(LogMixin, BackupMixin):
         self.save(data)
 
 
-# Creating an instance of DataHandler
-data_handler = DataHandler()
-
-# Demonstrating the use of process_and_save, which involves both logging and saving
-data_handler.process_and_save("Important data")
-# Output:
-# Log: Processing data: Important data
-# Saving data: Important data
-# Backing up data: Important data
+if __name__ == "__main__":
+    # Creating an instance of DataHandler
+    data_handler = DataHandler()
+
+    # Demonstrating the use of process_and_save, which involves both logging and saving
+    data_handler.process_and_save("Important data")
+    # Output:
+    # Log: Processing data: Important data
+    # Saving data: Important data
+    # Backing up data: Important data
 
 
 # --- Method Resolution Order (MRO) Explained ---
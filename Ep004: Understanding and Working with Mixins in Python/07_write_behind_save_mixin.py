@@ -0,0 +1,214 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+
+
+class WriteBehindStore:
+    """
+    The WriteBehindStore class persists records to an append-only file in groups.
+
+    A straightforward `save` writes one record and then calls `fsync` to make sure it
+    really reached the disk. `fsync` is slow (often milliseconds), so saving thousands
+    of records one by one spends almost all of its time waiting for the disk.
+
+    This store uses two well-known techniques to avoid that:
+
+    - Write-behind: `append` only adds the record to an in-memory batch and returns at
+      once. A background flusher thread does the actual writing.
+    - Group commit: the flusher writes the whole batch with one `write` call and makes
+      it durable with a single `fsync`. A batch is flushed as soon as it holds
+      `max_batch` records, or when its oldest record has waited `max_delay` seconds.
+
+    `append` returns a `concurrent.futures.Future`. Callers that do not care can ignore
+    it; callers that need durability call `future.result()`, which returns once the
+    record's group has been fsynced (or raises if writing it failed). `flush()` waits
+    for every record appended so far, including a group the flusher is still writing:
+    records are numbered as they are appended, and the flusher advances `_committed`
+    after each group, so `flush` waits until that count reaches the current number.
+    """
+
+    def __init__(self, path, max_batch=1024, max_delay=0.005):
+        self.path = path
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.groups_written = 0
+        self.records_written = 0
+        self._file = open(path, "ab")
+        self._batch = []
+        self._batch_started = None
+        self._appended = 0  # Records appended so far
+        self._committed = 0  # Records whose group has been written (or has failed)
+        self._condition = threading.Condition()
+        self._closed = False
+        self._flusher = threading.Thread(target=self._run, name="WriteBehindStore", daemon=True)
+        self._flusher.start()
+
+    def append(self, data):
+        future = Future()
+        line = (json.dumps(data) + "\n").encode()
+        with self._condition:
+            if self._closed:
+                raise ValueError("Cannot append to a closed store")
+            self._batch.append((line, future))
+            self._appended += 1
+            # `notify_all`, because callers of `flush` wait on the same condition as the flusher.
+            if len(self._batch) == 1:
+                # The first record of a batch starts its clock, and the flusher starts waiting for it.
+                self._batch_started = time.monotonic()
+                self._condition.notify_all()
+            elif len(self._batch) >= self.max_batch:
+                self._condition.notify_all()
+        return future
+
+    def flush(self):
+        # Waits until every record appended so far is durable, whether it is still in the batch or
+        # in the group the flusher is writing. Errors are reported to the record's own caller.
+        with self._condition:
+            target = self._appended
+            if self._batch:
+                self._batch_started = 0  # Makes the current batch overdue, so it is flushed right away.
+                self._condition.notify_all()
+            while self._committed < target and self._flusher.is_alive():
+                self._condition.wait(0.1)
+
+    def close(self):
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._flusher.join()
+        self._file.close()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._due():
+                    timeout = None
+                    if self._batch:
+                        timeout = max(self._batch_started + self.max_delay - time.monotonic(), 0)
+                    self._condition.wait(timeout)
+                group, self._batch = self._batch, []
+                closed = self._closed
+            if group:
+                self._commit(group)
+                with self._condition:
+                    self._committed += len(group)
+                    self._condition.notify_all()
+            if closed and not group:
+                return
+
+    def _due(self):
+        if self._closed:
+            return True
+        if not self._batch:
+            return False
+        return len(self._batch) >= self.max_batch or time.monotonic() - self._batch_started >= self.max_delay
+
+    def _commit(self, group):
+        try:
+            self._file.write(b"".join(line for line, _ in group))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError as error:
+            for _, future in group:
+                future.set_exception(error)
+            return
+        self.groups_written += 1
+        self.records_written += len(group)
+        for _, future in group:
+            future.set_result(None)
+
+
+class LogMixin:
+    """
+    The LogMixin class provides logging functionality that can be added to any class.
+    """
+
+    def log(self, message):
+        print(f"Log: {message}")
+
+
+class SaveMixin:
+    """
+    The SaveMixin class provides saving functionality, now backed by a WriteBehindStore.
+
+    `save` hands the record to the store and returns the store's future, without waiting
+    for the disk. The store is a class attribute, so every instance of a class that uses
+    the mixin shares the same file and the same group commits.
+    """
+
+    store = None
+
+    def save(self, data):
+        return self.store.append(data)
+
+
+class BackupMixin(SaveMixin):
+    """
+    The BackupMixin class from the previous example. It still calls the `save` method from
+    SaveMixin through super(), and passes its future on to the caller.
+    """
+
+    def save(self, data):
+        future = super().save(data)  # Call the save method from SaveMixin
+        print(f"Backing up data: {data}")
+        return future
+
+
+class DataHandler(LogMixin, BackupMixin):
+    """
+    The DataHandler class from the previous example, unchanged. It does not know that
+    saving now happens in the background.
+    """
+
+    def process_and_save(self, data):
+        self.log(f"Processing data: {data}")
+        self.save(data)
+
+
+if __name__ == "__main__":
+    temporary_directory = tempfile.TemporaryDirectory()
+    directory = temporary_directory.name
+    SaveMixin.store = WriteBehindStore(os.path.join(directory, "data.log"))
+
+    data_handler = DataHandler()
+    data_handler.process_and_save("Important data")
+    # Callers that need to know the record is on disk wait for its future.
+    data_handler.save({"id": 2, "payload": "Critical data"}).result()
+    with open(SaveMixin.store.path) as file:
+        print(file.read(), end="")
+    # Output:
+    # Log: Processing data: Important data
+    # Backing up data: Important data
+    # Backing up data: {'id': 2, 'payload': 'Critical data'}
+    # "Important data"
+    # {"id": 2, "payload": "Critical data"}
+
+
+    # --- Group commit versus one fsync per record ---
+    # Both loops write the same records; the store is called directly so the backup print does not skew the numbers.
+    records = 2_000
+
+    start = time.perf_counter()
+    with open(os.path.join(directory, "naive.log"), "ab") as file:
+        for number in range(records):
+            file.write((json.dumps({"id": number}) + "\n").encode())
+            file.flush()
+            os.fsync(file.fileno())
+    naive = time.perf_counter() - start
+
+    start = time.perf_counter()
+    futures = [SaveMixin.store.append({"id": number}) for number in range(records)]
+    for future in futures:
+        future.result()
+    grouped = time.perf_counter() - start
+
+    print(f"One fsync per record: {records / naive:,.0f} records/sec")
+    print(f"Group commit: {records / grouped:,.0f} records/sec "
+          f"({SaveMixin.store.groups_written} fsyncs for {SaveMixin.store.records_written} records)")
+    SaveMixin.store.close()
+    temporary_directory.cleanup()
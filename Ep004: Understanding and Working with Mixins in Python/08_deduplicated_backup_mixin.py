@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import random
+import tempfile
+import time
+
+
+class DedupBackupStore:
+    """
+    The DedupBackupStore class keeps incremental, deduplicated backups.
+
+    The BackupMixin in the MRO example backs up the whole payload on every save, so the
+    work grows with the size of the data, even if only a few bytes changed. This store
+    makes the work grow with the size of the change instead:
+
+    - Content-defined chunking: the payload is cut into chunks wherever a rolling hash
+      of the last few bytes hits a fixed pattern. Because the cut points depend on the
+      content and not on the position, inserting or changing bytes only moves the cut
+      points near the change. All other chunks stay exactly the same.
+    - Content addressing: every chunk is stored under its SHA-256 hash, so a chunk that
+      is already stored is never written again.
+    - Snapshots: a backup is a small manifest listing the hashes of its chunks in order.
+      Restoring joins the chunks again, and comparing two snapshots compares their lists.
+
+    The chunk sizes are kept small here so the example payloads produce several chunks;
+    real backup tools use averages of several kilobytes to a few megabytes.
+    """
+
+    def __init__(self, directory, min_size=512, average_bits=11, max_size=8192):
+        self.directory = directory
+        self.min_size = min_size
+        self.max_size = max_size
+        # A cut point is where the low `average_bits` bits of the rolling hash are all zero,
+        # which happens on average once every 2 ** average_bits bytes.
+        self.mask = (1 << average_bits) - 1
+        # The "gear" table maps every byte value to a fixed random number. A fixed seed keeps
+        # the cut points (and therefore the deduplication) stable between runs.
+        generator = random.Random(0x5EED)
+        self.gear = [generator.getrandbits(32) for _ in range(256)]
+        self.bytes_written = 0
+        self.chunks_written = 0
+        self.chunks_reused = 0
+        os.makedirs(os.path.join(directory, "chunks"), exist_ok=True)
+        os.makedirs(os.path.join(directory, "snapshots"), exist_ok=True)
+        self._known_chunks = set(os.listdir(os.path.join(directory, "chunks")))
+
+    def chunk(self, payload):
+        # Gear hashing: every byte shifts the hash left and adds the byte's random number,
+        # so the hash only depends on the last 32 bytes or so.
+        gear, mask, min_size, max_size = self.gear, self.mask, self.min_size, self.max_size
+        chunks = []
+        start = 0
+        rolling = 0
+        for position, byte in enumerate(payload):
+            rolling = ((rolling << 1) + gear[byte]) & 0xFFFFFFFF
+            length = position - start + 1
+            if (length >= min_size and not rolling & mask) or length >= max_size:
+                chunks.append(payload[start : position + 1])
+                start = position + 1
+                rolling = 0
+        if start < len(payload):
+            chunks.append(payload[start:])
+        return chunks
+
+    def backup(self, payload):
+        hashes = []
+        for chunk in self.chunk(payload):
+            digest = hashlib.sha256(chunk).hexdigest()
+            hashes.append(digest)
+            if digest in self._known_chunks:
+                self.chunks_reused += 1
+                continue
+            # Written to a temporary name first, so a crash never leaves a half-written chunk
+            # under its final name.
+            path = os.path.join(self.directory, "chunks", digest)
+            with open(path + ".tmp", "wb") as file:
+                file.write(chunk)
+            os.replace(path + ".tmp", path)
+            self._known_chunks.add(digest)
+            self.chunks_written += 1
+            self.bytes_written += len(chunk)
+
+        # One more than the highest id, not the number of snapshots: after a snapshot is
+        # deleted, counting would hand out an id that is still in use.
+        snapshot_id = max(self.snapshots(), default=0) + 1
+        manifest = {"id": snapshot_id, "created": time.time(), "size": len(payload), "chunks": hashes}
+        path = self._manifest_path(snapshot_id)
+        with open(path + ".tmp", "w") as file:
+            json.dump(manifest, file)
+        os.replace(path + ".tmp", path)
+        return snapshot_id
+
+    def snapshots(self):
+        # Only finished manifests; a crash can leave a "<id>.json.tmp" file behind.
+        names = os.listdir(os.path.join(self.directory, "snapshots"))
+        return sorted(int(name[: -len(".json")]) for name in names if name.endswith(".json"))
+
+    def manifest(self, snapshot_id):
+        with open(self._manifest_path(snapshot_id)) as file:
+            return json.load(file)
+
+    def restore(self, snapshot_id):
+        parts = []
+        for digest in self.manifest(snapshot_id)["chunks"]:
+            with open(os.path.join(self.directory, "chunks", digest), "rb") as file:
+                parts.append(file.read())
+        return b"".join(parts)
+
+    def compare(self, old_id, new_id):
+        # Which chunks the newer snapshot added, and which ones of the older snapshot it no longer uses.
+        old_chunks = set(self.manifest(old_id)["chunks"])
+        new_chunks = set(self.manifest(new_id)["chunks"])
+        added = new_chunks - old_chunks
+        return {
+            "added_chunks": len(added),
+            "removed_chunks": len(old_chunks - new_chunks),
+            "shared_chunks": len(old_chunks & new_chunks),
+            "added_bytes": sum(os.path.getsize(os.path.join(self.directory, "chunks", digest)) for digest in added),
+        }
+
+    def _manifest_path(self, snapshot_id):
+        return os.path.join(self.directory, "snapshots", f"{snapshot_id}.json")
+
+
+class LogMixin:
+    """
+    The LogMixin class provides logging functionality that can be added to any class.
+    """
+
+    def log(self, message):
+        print(f"Log: {message}")
+
+
+class SaveMixin:
+    """
+    The SaveMixin class provides saving functionality.
+    """
+
+    def save(self, data):
+        print(f"Saving data: {len(data)} bytes")
+
+
+class BackupMixin(SaveMixin):
+    """
+    The BackupMixin class inherits from SaveMixin and overrides the `save` method.
+
+    As before, it first calls the original `save` method through super(). The backup
+    itself is now handed to a DedupBackupStore, which only writes the chunks it has not
+    seen before and records the save as a snapshot. The store is a class attribute, so
+    all instances share one chunk store.
+    """
+
+    backup_store = None
+
+    def save(self, data):
+        super().save(data)  # Call the save method from SaveMixin
+        payload = data if isinstance(data, bytes) else str(data).encode()
+        written_before = self.backup_store.bytes_written
+        snapshot_id = self.backup_store.backup(payload)
+        print(f"Backing up data: snapshot {snapshot_id}, {self.backup_store.bytes_written - written_before} new bytes")
+        return snapshot_id
+
+
+class DataHandler(LogMixin, BackupMixin):
+    """
+    The DataHandler class from the MRO example, unchanged.
+    """
+
+    def process_and_save(self, data):
+        self.log(f"Processing data: {len(data)} bytes")
+        self.save(data)
+
+
+if __name__ == "__main__":
+    temporary_directory = tempfile.TemporaryDirectory()
+    BackupMixin.backup_store = DedupBackupStore(temporary_directory.name)
+
+    # About 100 KB of data, then the same data with a few bytes changed in the middle.
+    payload = random.Random(1).randbytes(100_000)
+    changed = payload[:50_000] + b"a small edit" + payload[50_000:]
+
+    data_handler = DataHandler()
+    data_handler.process_and_save(payload)
+    data_handler.process_and_save(changed)
+    # Output (the number of new bytes in the second backup depends on where the cut points fall):
+    # Log: Processing data: 100000 bytes
+    # Saving data: 100000 bytes
+    # Backing up data: snapshot 1, 100000 new bytes
+    # Log: Processing data: 100012 bytes
+    # Saving data: 100012 bytes
+    # Backing up data: snapshot 2, ... new bytes
+
+    store = BackupMixin.backup_store
+    assert store.restore(1) == payload and store.restore(2) == changed
+    print(store.compare(1, 2))
+    print(f"Chunks written: {store.chunks_written}, reused: {store.chunks_reused}")
+    temporary_directory.cleanup()
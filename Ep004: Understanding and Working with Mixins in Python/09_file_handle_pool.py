@@ -0,0 +1,264 @@
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Not available on Windows, where we fall back to a fixed limit.
+    resource = None
+
+
+class FileHandlePool:
+    """
+    The FileHandlePool class keeps recently used files open, so they can be reused.
+
+    Opening a file costs several system calls (path lookup, permission checks, allocating
+    a file descriptor), and closing it costs more. When a program reads the same few
+    thousand files over and over, most of that work is repeated for nothing. Like the
+    ConnectionPool in `10_connection_pool.py`, the pool lends handles out and takes them
+    back: `with pool.open(path) as file:` borrows a handle for the duration of the block
+    (or call `acquire` and `release` yourself). A borrowed handle belongs to one caller
+    only, so nobody else can move its file position; two callers that read the same file
+    at the same time get two handles. The returned handles are kept by (path, mode):
+
+    - Hit: an idle handle for the file exists. One `os.stat` call checks that it is still
+      the same file (same device, inode and modification time); if it is, the handle is
+      rewound and lent out again.
+    - Invalidation: the file was replaced or modified since we opened it, or the handle
+      was closed by its borrower, so the old handle is dropped and the file is opened again.
+    - Miss: no idle handle, so the file is opened.
+    - Eviction: a new handle is needed but `max_handles` handles are already open, so the
+      least recently used idle one is closed. An OrderedDict keeps the files in order of
+      use, which makes this cheap.
+
+    `max_handles` counts borrowed handles as well as idle ones, so the pool never has more
+    files open than that. Like ConnectionPool, when every handle is borrowed, `acquire`
+    waits up to `timeout` seconds for one to come back and then raises TimeoutError.
+    By default `max_handles` stays well below the process's limit on open files. Modes
+    that create or truncate a file ("w", "x") are rejected, because a reused handle would
+    not truncate the file again.
+    """
+
+    def __init__(self, max_handles=1024, timeout=5.0):
+        if max_handles < 1:
+            raise ValueError("max_handles must be at least 1")
+        self.max_handles = min(max_handles, self.descriptor_budget())
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._idle = OrderedDict()  # (path, mode) -> [(handle, signature), ...], least recently used first
+        self._idle_count = 0
+        self._borrowed = {}  # handle -> ((path, mode), signature)
+        self._opening = 0  # Slots taken by handles that are being opened outside the lock
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)  # Notified when a slot frees up
+
+    @staticmethod
+    def descriptor_budget():
+        # Leave half of the process's file descriptors for sockets, pipes and other files.
+        if resource is None:
+            return 256
+        soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft_limit == resource.RLIM_INFINITY:
+            return 1 << 16
+        return max(soft_limit // 2, 1)
+
+    def acquire(self, path, mode="r"):
+        if "w" in mode or "x" in mode:
+            raise ValueError(f"Mode {mode!r} cannot be pooled, it would not truncate or create the file again")
+        status = os.stat(path)
+        signature = (status.st_dev, status.st_ino, status.st_mtime_ns)
+        key = (path, mode)
+        deadline = time.monotonic() + self.timeout
+        with self._available:
+            while True:
+                handle = self._take_idle(key, signature)
+                if handle is not None:
+                    self.hits += 1
+                    handle.seek(0)
+                    self._borrowed[handle] = (key, signature)
+                    return handle
+                if self._idle_count + len(self._borrowed) + self._opening < self.max_handles:
+                    break
+                if self._idle_count:
+                    self._evict_oldest()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._available.wait(remaining):
+                    raise TimeoutError(f"All {self.max_handles} file handles are borrowed")
+            self.misses += 1
+            self._opening += 1
+        # Opening happens outside the lock, so other threads can keep using the pool.
+        try:
+            handle = open(path, mode)
+        except BaseException:
+            with self._available:
+                self._opening -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            self._opening -= 1
+            self._borrowed[handle] = (key, signature)
+        return handle
+
+    def _take_idle(self, key, signature):
+        # Returns an idle handle that is still valid for `signature`, closing the stale ones on the way.
+        idle = self._idle.get(key)
+        while idle:
+            handle, known_signature = idle.pop()
+            self._idle_count -= 1
+            if known_signature == signature and not handle.closed:
+                if not idle:
+                    del self._idle[key]
+                return handle
+            self.invalidations += 1
+            handle.close()
+        if idle is not None:
+            del self._idle[key]
+        return None
+
+    def _evict_oldest(self):
+        oldest_key, handles = next(iter(self._idle.items()))
+        oldest, _ = handles.pop(0)
+        if not handles:
+            del self._idle[oldest_key]
+        self._idle_count -= 1
+        oldest.close()
+        self.evictions += 1
+
+    def release(self, handle):
+        with self._available:
+            try:
+                key, signature = self._borrowed.pop(handle)
+            except KeyError:
+                raise ValueError(f"{handle!r} was not lent by this pool, or was already released") from None
+            if not handle.closed:
+                self._idle.setdefault(key, []).append((handle, signature))
+                self._idle.move_to_end(key)
+                self._idle_count += 1
+            self._available.notify()
+
+    @contextmanager
+    def open(self, path, mode="r"):
+        handle = self.acquire(path, mode)
+        try:
+            yield handle
+        finally:
+            self.release(handle)
+
+    def close(self):
+        # Like ConnectionPool.close, this closes the idle handles; borrowed ones come back as usual.
+        with self._lock:
+            for handles in self._idle.values():
+                for handle, _ in handles:
+                    handle.close()
+            self._idle.clear()
+            self._idle_count = 0
+
+    def stats(self):
+        return {
+            "open": self._idle_count + len(self._borrowed),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class LogMixin:
+    """
+    The LogMixin class provides logging functionality that can be added to any class.
+    """
+
+    def log(self, message):
+        print(f"Log: {message}")
+
+
+class FileHandler(LogMixin):
+    """
+    The FileHandler class from the earlier examples, now with a real `open_file`.
+
+    Instead of opening the file on every call, it asks the shared FileHandlePool for a
+    handle, and gives it back when the `with` block ends. The pool is a class attribute,
+    so all FileHandler instances share it.
+    """
+
+    file_pool = FileHandlePool()
+
+    @contextmanager
+    def open_file(self, filename, mode="r"):
+        self.log(f"Opening file: {filename}")
+        with self.file_pool.open(filename, mode) as handle:
+            print(f"File {filename} opened successfully")
+            yield handle
+
+
+if __name__ == "__main__":
+    temporary_directory = tempfile.TemporaryDirectory()
+    example_path = os.path.join(temporary_directory.name, "example.txt")
+    with open(example_path, "w") as file:
+        file.write("first version")
+
+    file_handler = FileHandler()
+    with file_handler.open_file(example_path) as file:
+        print(file.read())
+    with file_handler.open_file(example_path) as file:  # Served from the pool
+        print(file.read())
+
+    # Replacing the file changes its inode, so the pooled handle is invalidated.
+    with open(example_path + ".new", "w") as file:
+        file.write("second version")
+    os.replace(example_path + ".new", example_path)
+    with file_handler.open_file(example_path) as file:
+        print(file.read())
+    print(FileHandler.file_pool.stats())
+    # Output:
+    # Log: Opening file: /tmp/.../example.txt
+    # File /tmp/.../example.txt opened successfully
+    # first version
+    # Log: Opening file: /tmp/.../example.txt
+    # File /tmp/.../example.txt opened successfully
+    # first version
+    # Log: Opening file: /tmp/.../example.txt
+    # File /tmp/.../example.txt opened successfully
+    # second version
+    # {'open': 1, 'hits': 1, 'misses': 2, 'evictions': 0, 'invalidations': 1}
+
+
+    # --- Pooled versus unpooled open-read loops ---
+    # 200 files, read 50,000 times in random order, mostly from a working set of 120 files.
+    # The pool holds 128 handles, so the occasional read outside the working set causes evictions.
+    paths = []
+    for number in range(200):
+        path = os.path.join(temporary_directory.name, f"file_{number}.txt")
+        with open(path, "w") as file:
+            file.write(f"contents of file {number}\n" * 10)
+        paths.append(path)
+    generator = random.Random(2)
+    reads = [generator.choice(paths[:120] if number % 10 else paths) for number in range(50_000)]
+
+    start = time.perf_counter()
+    for path in reads:
+        with open(path) as file:
+            file.read()
+    unpooled = time.perf_counter() - start
+
+    pool = FileHandlePool(max_handles=128)
+    start = time.perf_counter()
+    for path in reads:
+        file = pool.acquire(path)
+        file.read()
+        pool.release(file)
+    pooled = time.perf_counter() - start
+
+    print(f"Unpooled: {len(reads) / unpooled:,.0f} reads/sec")
+    print(f"Pooled: {len(reads) / pooled:,.0f} reads/sec {pool.stats()}")
+    pool.close()
+    FileHandler.file_pool.close()
+    temporary_directory.cleanup()
@@ -0,0 +1,371 @@
+import asyncio
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+
+
+class EchoServer:
+    """
+    The EchoServer class is a tiny TCP server on the loopback interface that sends back
+    every line it receives. It lets us test and benchmark the connection pools offline.
+    """
+
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                self.wfile.write(line)
+
+    class _Server(socketserver.ThreadingTCPServer):
+        allow_reuse_address = True
+        daemon_threads = True
+
+    def __init__(self):
+        self._server = self._Server(("127.0.0.1", 0), self._Handler)
+        self.address = self._server.server_address
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class ConnectionPool:
+    """
+    The ConnectionPool class reuses TCP connections to one address.
+
+    Every new TCP connection starts with a handshake: a full network round trip before
+    the first byte of data can be sent (and more for TLS). When a client talks to the
+    same server again and again, keeping connections open ("keep-alive") and reusing
+    them avoids that cost. The pool:
+
+    - opens `min_size` connections up front and never holds more than `max_size`,
+      callers wait (up to `timeout` seconds) when all of them are in use,
+    - closes connections that have been idle for longer than `idle_timeout`, because
+      servers and firewalls quietly drop idle connections anyway,
+    - checks every connection on checkout: a non-blocking peek that returns no data
+      means the server has closed its end, so the connection is replaced.
+
+    Use `with pool.connection() as sock:` to borrow a connection. If the block raises,
+    the connection is closed instead of being returned, since its state is unknown.
+    """
+
+    def __init__(self, address, min_size=1, max_size=10, idle_timeout=30.0, timeout=5.0):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+        self.address = address
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self._idle = deque()  # (socket, time it was returned), most recently used on the right
+        self._size = 0  # Open connections, idle or in use
+        self._available = threading.Condition()
+        for _ in range(min_size):
+            self._idle.append((self._connect(), time.monotonic()))
+            self._size += 1
+
+    def _connect(self):
+        self.created += 1
+        sock = socket.create_connection(self.address, timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        return sock
+
+    def is_healthy(self, sock):
+        # A healthy idle connection has nothing to read, so a non-blocking peek raises
+        # BlockingIOError. An empty result means the peer closed the connection.
+        try:
+            sock.setblocking(False)
+            try:
+                return sock.recv(1, socket.MSG_PEEK) != b""
+            finally:
+                sock.settimeout(self.timeout)
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        with self._available:
+            while True:
+                self._close_expired()
+                while self._idle:
+                    sock, _ = self._idle.pop()
+                    if self.is_healthy(sock):
+                        self.reused += 1
+                        return sock
+                    self._discard(sock)
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._available.wait(remaining):
+                    raise TimeoutError(f"No connection to {self.address} became available")
+        # Connecting happens outside the lock, so other threads can keep using the pool.
+        try:
+            sock = self._connect()
+        except BaseException:  # Also KeyboardInterrupt, or the slot would be lost for good
+            with self._available:
+                self._size -= 1
+                self._available.notify()
+            raise
+        return sock
+
+    def release(self, sock, reusable=True):
+        with self._available:
+            if reusable:
+                self._idle.append((sock, time.monotonic()))
+            else:
+                self._discard(sock)
+            self._available.notify()
+
+    @contextmanager
+    def connection(self):
+        sock = self.acquire()
+        try:
+            yield sock
+        except BaseException:
+            self.release(sock, reusable=False)
+            raise
+        self.release(sock)
+
+    def close(self):
+        with self._available:
+            while self._idle:
+                self._discard(self._idle.pop()[0])
+
+    def _close_expired(self):
+        # The oldest idle connections are on the left. We keep at least `min_size` connections open.
+        now = time.monotonic()
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+            self._discard(self._idle.popleft()[0])
+
+    def _discard(self, sock):
+        self.discarded += 1
+        self._size -= 1
+        sock.close()
+
+
+class AsyncConnectionPool:
+    """
+    The AsyncConnectionPool class is the asyncio counterpart of ConnectionPool.
+
+    It keeps (reader, writer) stream pairs instead of sockets, and waits on an
+    `asyncio.Condition` instead of blocking a thread. The health check uses
+    `reader.at_eof()`, which becomes true once the server has closed its end.
+    Connections can only be opened inside a running event loop, so the `min_size`
+    connections are opened by the first `acquire` instead of by the constructor.
+    """
+
+    def __init__(self, address, min_size=0, max_size=10, idle_timeout=30.0, timeout=5.0):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+        self.address = address
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self._idle = deque()
+        self._size = 0
+        self._available = None  # Created lazily, inside the running event loop
+        self._filled = False  # Set once the `min_size` connections have been opened
+
+    async def acquire(self):
+        if self._available is None:
+            self._available = asyncio.Condition()
+        if not self._filled:
+            await self._open_min_size()
+        async with self._available:
+            while True:
+                now = time.monotonic()
+                while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+                    self._discard(self._idle.popleft()[0])
+                while self._idle:
+                    streams, _ = self._idle.pop()
+                    if not streams[0].at_eof() and not streams[1].is_closing():
+                        self.reused += 1
+                        return streams
+                    self._discard(streams)
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                await asyncio.wait_for(self._available.wait(), self.timeout)
+        try:
+            return await self._connect()
+        except BaseException:  # Also cancellation, or the slot would be lost for good
+            async with self._available:
+                self._size -= 1
+                self._available.notify()
+            raise
+
+    async def _connect(self):
+        streams = await asyncio.wait_for(asyncio.open_connection(*self.address), self.timeout)
+        self.created += 1
+        return streams
+
+    async def _open_min_size(self):
+        # Holds the condition's lock, so other first callers wait for these connections
+        # instead of opening their own. If one of them fails, the next `acquire` tries again.
+        async with self._available:
+            while self._size < self.min_size:
+                self._size += 1
+                try:
+                    streams = await self._connect()
+                except BaseException:
+                    self._size -= 1
+                    raise
+                self._idle.append((streams, time.monotonic()))
+            self._filled = True
+
+    async def release(self, streams, reusable=True):
+        async with self._available:
+            if reusable:
+                self._idle.append((streams, time.monotonic()))
+            else:
+                self._discard(streams)
+            self._available.notify()
+
+    @asynccontextmanager
+    async def connection(self):
+        streams = await self.acquire()
+        try:
+            yield streams
+        except BaseException:
+            await self.release(streams, reusable=False)
+            raise
+        await self.release(streams)
+
+    async def close(self):
+        while self._idle:
+            self._discard(self._idle.pop()[0])
+
+    def _discard(self, streams):
+        self.discarded += 1
+        self._size -= 1
+        streams[1].close()
+
+
+class LogMixin:
+    """
+    The LogMixin class provides logging functionality that can be added to any class.
+    """
+
+    def log(self, message):
+        print(f"Log: {message}")
+
+
+class NetworkHandler(LogMixin):
+    """
+    The NetworkHandler class from `04_mixin_vs_inheritance.py`, now with connection reuse.
+
+    `connect` no longer opens a new connection on every call. It borrows one from the
+    pool for the address (one pool per address, shared by all instances) and returns
+    the pool's context manager, so the caller gives the connection back when done.
+    `pool_options` configure the pool when the first call creates it; later calls may
+    repeat them, but passing different ones raises ValueError instead of being ignored.
+    """
+
+    pools = {}
+    pool_options = {}  # The options each pool in `pools` was created with
+
+    def connect(self, address, **pool_options):
+        self.log(f"Connecting to {address}")
+        pool = self.pools.get(address)
+        if pool is None:
+            pool = self.pools[address] = ConnectionPool(address, **pool_options)
+            self.pool_options[address] = pool_options
+        elif pool_options and pool_options != self.pool_options[address]:
+            raise ValueError(f"The pool for {address} was created with {self.pool_options[address]}, not {pool_options}")
+        print(f"Connected to {address}")
+        return pool.connection()
+
+
+def _request(sock, payload=b"ping\n"):
+    sock.sendall(payload)
+    received = b""
+    while not received.endswith(b"\n"):
+        chunk = sock.recv(4096)
+        if not chunk:
+            # The server closed the connection. Raising inside `pool.connection()` discards it.
+            raise ConnectionError("Connection closed before the whole reply arrived")
+        received += chunk
+    return received
+
+
+if __name__ == "__main__":
+    with EchoServer() as server:
+        network_handler = NetworkHandler()
+        with network_handler.connect(server.address) as sock:
+            print(_request(sock, b"hello\n"))
+        with network_handler.connect(server.address) as sock:  # Reuses the same connection
+            print(_request(sock, b"hello again\n"))
+        pool = NetworkHandler.pools[server.address]
+        print(f"created: {pool.created}, reused: {pool.reused}")
+        # Output:
+        # Log: Connecting to ('127.0.0.1', ...)
+        # Connected to ('127.0.0.1', ...)
+        # b'hello\n'
+        # Log: Connecting to ('127.0.0.1', ...)
+        # Connected to ('127.0.0.1', ...)
+        # b'hello again\n'
+        # created: 1, reused: 2  (the first checkout already reuses the connection opened for min_size)
+
+        # --- Pooled versus fresh connections ---
+        requests = 2_000
+
+        connect_times = []
+        start = time.perf_counter()
+        for _ in range(requests):
+            connect_start = time.perf_counter()
+            with socket.create_connection(server.address) as fresh:
+                connect_times.append(time.perf_counter() - connect_start)
+                _request(fresh)
+        fresh_rate = requests / (time.perf_counter() - start)
+
+        checkout_times = []
+        start = time.perf_counter()
+        for _ in range(requests):
+            checkout_start = time.perf_counter()
+            with pool.connection() as pooled:
+                checkout_times.append(time.perf_counter() - checkout_start)
+                _request(pooled)
+        pooled_rate = requests / (time.perf_counter() - start)
+
+        print(f"Fresh: {fresh_rate:,.0f} requests/sec, "
+              f"median connect {sorted(connect_times)[requests // 2] * 1e6:.0f} us")
+        print(f"Pooled: {pooled_rate:,.0f} requests/sec, "
+              f"median checkout {sorted(checkout_times)[requests // 2] * 1e6:.0f} us")
+        pool.close()
+
+        async def async_example():
+            async_pool = AsyncConnectionPool(server.address, max_size=4)
+
+            async def echo(number):
+                async with async_pool.connection() as (reader, writer):
+                    writer.write(f"request {number}\n".encode())
+                    await writer.drain()
+                    # Unlike `readline`, `readuntil` raises at end of file, so a closed connection is discarded.
+                    return await reader.readuntil(b"\n")
+
+            start = time.perf_counter()
+            replies = await asyncio.gather(*(echo(number) for number in range(requests)))
+            rate = requests / (time.perf_counter() - start)
+            await async_pool.close()
+            print(f"Async pooled: {rate:,.0f} requests/sec over {async_pool.created} connections, "
+                  f"{replies[-1]!r}")
+
+        asyncio.run(async_example())
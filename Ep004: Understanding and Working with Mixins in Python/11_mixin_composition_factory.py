@@ -0,0 +1,266 @@
+import timeit
+from functools import lru_cache
+
+if __package__:
+    from ._codegen import compile_wrapper, copied_parameters
+else:  # Run as a script from this folder
+    from _codegen import compile_wrapper, copied_parameters
+
+# The mixins in this example append what they do to this journal instead of printing it,
+# so we can compare the behaviour of different classes and time them without measuring `print`.
+journal = []
+
+
+class after_super:
+    """
+    The after_super decorator describes a cooperative method in a form that can be flattened.
+
+    In the MRO example, BackupMixin.save looks like this:
+
+        def save(self, data):
+            super().save(data)
+            print(f"Backing up data: {data}")
+
+    Python cannot see inside that function, so it has to follow the `super()` chain on
+    every call. Written as
+
+        @after_super
+        def save(self, data):
+            journal.append(("backup", data))
+
+    the method does exactly the same thing when it is called normally: it calls the next
+    `save` in the MRO, then runs its own step, and returns the result of the chain. But
+    because the step is now a separate function, `compose(..., flatten=["save"])` can
+    line up all steps of the chain in advance (see `flatten_method`).
+
+    `before_super` is the mirror image: the step runs first, then the rest of the chain.
+    """
+
+    order = "after"
+
+    def __init__(self, step):
+        self.step = step
+
+    def __set_name__(self, owner, name):
+        # Called when the class body is finished, so we know the class and the method name
+        # and can build the regular, `super()`-based method. Like `flatten_method`, it is
+        # generated with the step's parameters (see `_codegen.py`), which makes a call about
+        # twice as fast as `*args, **kwargs` forwarding and a `getattr` by name.
+        step = self.step
+        order = self.order
+        if order == "after":
+            template = (
+                "def {name}({signature}):\n"
+                "    {result} = super({owner}, {self}).{name}({rest})\n"
+                "    {step}({arguments})\n"
+                "    return {result}\n"
+            )
+        else:
+            template = (
+                "def {name}({signature}):\n"
+                "    {step}({arguments})\n"
+                "    return super({owner}, {self}).{name}({rest})\n"
+            )
+        method = compile_wrapper(
+            template, copied_parameters(step), {"owner": owner, "step": step}, ["result"], name=name
+        )
+        method.__qualname__ = f"{owner.__qualname__}.{name}"
+        method.__doc__ = step.__doc__
+        method.__cooperative__ = (order, step)
+        setattr(owner, name, method)
+
+
+class before_super(after_super):
+    order = "before"
+
+
+def flatten_method(cls, name):
+    """
+    Builds a single function that runs the whole cooperative chain for `name` on `cls`.
+
+    We walk the MRO once: every cooperative method contributes its step, and the first
+    ordinary method ends the chain (that is where the last `super()` call would land).
+    "Before" steps run in MRO order, "after" steps run in reverse MRO order, because the
+    innermost `super()` call returns first. The result is generated as straight-line code,
+    so a call costs one Python function call per step and no `super()` lookups at all.
+    All steps are called with the terminal method's arguments.
+    """
+    before, after = [], []
+    for klass in cls.__mro__:
+        function = klass.__dict__.get(name)
+        if function is None:
+            continue
+        cooperative = getattr(function, "__cooperative__", None)
+        if cooperative is None:
+            terminal = function
+            break
+        order, step = cooperative
+        (before if order == "before" else after).append(step)
+    else:
+        raise TypeError(f"The chain for {cls.__name__}.{name} does not end in an ordinary method")
+
+    # Forwarding `*args, **kwargs` costs more than the `super()` lookups we are removing,
+    # so the function copies the terminal method's parameters when it can (see `_codegen.py`).
+    helpers = {"terminal": terminal}
+    lines = ["def {name}({signature}):"]
+    for number, step in enumerate(before):
+        helpers[f"before_{number}"] = step
+        lines.append(f"    {{before_{number}}}({{arguments}})")
+    lines.append("    {result} = {terminal}({arguments})")
+    for number, step in enumerate(reversed(after)):
+        helpers[f"after_{number}"] = step
+        lines.append(f"    {{after_{number}}}({{arguments}})")
+    lines.append("    return {result}")
+    template = "\n".join(lines) + "\n"
+    function = compile_wrapper(template, copied_parameters(terminal), helpers, ["result"], name=name)
+    function.__qualname__ = f"{cls.__qualname__}.{name}"
+    function.__flattened__ = tuple(before) + (terminal,) + tuple(reversed(after))
+    return function
+
+
+def compose(*mixins, flatten=(), name=None):
+    """
+    Builds (or returns the cached) class that inherits from `mixins`, in the given order.
+
+    Creating a class is relatively expensive and every call to `type()` makes a new,
+    different class, so the result is cached by the mixin tuple: composing the same
+    mixins again returns the very same class. Method names listed in `flatten` are
+    replaced by their flattened chain (see `flatten_method`).
+    """
+    return _compose(tuple(mixins), tuple(flatten), name)
+
+
+@lru_cache(maxsize=None)
+def _compose(mixins, flatten, name):
+    name = name or "".join(mixin.__name__.replace("Mixin", "") for mixin in mixins) + "Handler"
+    cls = type(name, mixins, {"__module__": __name__, "__flattened_methods__": flatten})
+    for method_name in flatten:
+        setattr(cls, method_name, flatten_method(cls, method_name))
+    return cls
+
+
+class LogMixin:
+    """
+    The LogMixin class from the MRO example.
+    """
+
+    def log(self, message):
+        journal.append(("log", message))
+
+
+class SaveMixin:
+    """
+    The SaveMixin class from the MRO example. Its `save` is an ordinary method, so it
+    ends the cooperative chain.
+    """
+
+    def save(self, data):
+        journal.append(("save", data))
+        return len(journal)
+
+
+class BackupMixin(SaveMixin):
+    """
+    The BackupMixin class from the MRO example, written with `after_super`: it first
+    calls the `save` method from SaveMixin, then backs up the data.
+    """
+
+    @after_super
+    def save(self, data):
+        journal.append(("backup", data))
+
+
+class AuditMixin:
+    """
+    An extra cooperative mixin that records every save attempt before it happens, to
+    show that `before_super` and `after_super` steps can be mixed in one chain.
+    """
+
+    @before_super
+    def save(self, data):
+        journal.append(("audit", data))
+
+
+class ProcessMixin:
+    """
+    The `process_and_save` method of DataHandler, as a mixin so `compose` can use it.
+    """
+
+    def process_and_save(self, data):
+        self.log(f"Processing data: {data}")
+        self.save(data)
+
+
+class DataHandler(LogMixin, BackupMixin):
+    """
+    The hand-written DataHandler from the MRO example.
+    """
+
+    def process_and_save(self, data):
+        self.log(f"Processing data: {data}")
+        self.save(data)
+
+
+class ClassicBackupMixin(SaveMixin):
+    """
+    BackupMixin exactly as it was written in the MRO example, with a plain `super()` call.
+    """
+
+    def save(self, data):
+        result = super().save(data)
+        journal.append(("backup", data))
+        return result
+
+
+class ClassicDataHandler(LogMixin, ClassicBackupMixin):
+    """
+    The hand-written DataHandler with the classic BackupMixin, used as the reference behaviour.
+    """
+
+    def process_and_save(self, data):
+        self.log(f"Processing data: {data}")
+        self.save(data)
+
+
+def run(handler, items=("Important data", "More data")):
+    journal.clear()
+    results = []
+    for item in items:
+        handler.process_and_save(item)
+        results.append(handler.save(item))
+    return list(journal), results
+
+
+if __name__ == "__main__":
+    # Building classes at runtime, with caching.
+    ComposedHandler = compose(ProcessMixin, LogMixin, BackupMixin)
+    FlatHandler = compose(ProcessMixin, LogMixin, BackupMixin, flatten=["save"])
+    print(ComposedHandler.__name__, [klass.__name__ for klass in ComposedHandler.__mro__])
+    print([step.__qualname__ for step in FlatHandler.save.__flattened__])
+    # Output:
+    # ProcessLogBackupHandler ['ProcessLogBackupHandler', 'ProcessMixin', 'LogMixin', 'BackupMixin', 'SaveMixin', 'object']
+    # ['SaveMixin.save', 'BackupMixin.save']
+
+
+    # --- The flattened classes behave exactly like the normal MRO (checked in tests/) ---
+    print(run(FlatHandler())[0][:3])
+    # Output:
+    # [('log', 'Processing data: Important data'), ('save', 'Important data'), ('backup', 'Important data')]
+
+    FlatAuditedHandler = compose(ProcessMixin, AuditMixin, LogMixin, BackupMixin, flatten=["save"])
+    print(run(FlatAuditedHandler())[0][1:4])
+    # Output:
+    # [('audit', 'Important data'), ('save', 'Important data'), ('backup', 'Important data')]
+
+
+    # --- Per-call dispatch cost of `save` ---
+    calls = 300_000
+    for label, handler in [
+        ("hand-written DataHandler (super())", ClassicDataHandler()),
+        ("composed, normal MRO", ComposedHandler()),
+        ("composed, flattened", FlatHandler()),
+    ]:
+        journal.clear()
+        seconds = timeit.timeit(lambda: handler.save("x"), number=calls)
+        print(f"{label}: {seconds / calls * 1e9:.0f} ns per call")
+    journal.clear()
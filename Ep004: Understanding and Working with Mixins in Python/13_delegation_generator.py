@@ -0,0 +1,201 @@
+import inspect
+import time
+import tracemalloc
+
+if __package__:
+    from ._codegen import compile_wrapper, copied_parameters
+else:  # Run as a script from this folder
+    from _codegen import compile_wrapper, copied_parameters
+
+
+class delegate:
+    """
+    The delegate marker declares a component attribute and the methods to forward to it.
+
+    In the composition example, Car forwards `start` to its engine by hand:
+
+        def start(self):
+            return self.engine.start()
+
+    That is fast, but it has to be written (and kept up to date) for every method. The
+    generic shortcut, a `__getattr__` that forwards every unknown attribute, is slow:
+    Python only calls `__getattr__` after the normal lookup has failed, and then has to
+    look the method up again on the component.
+
+    With `delegate`, the forwarding methods are generated once, when the class is
+    created, by the Delegating metaclass:
+
+        class Car(metaclass=Delegating):
+            engine = delegate("start", spec=Engine)
+
+    gives Car a real `start` method that does `return self.engine.start()`. When `spec`
+    (the component's class) is given, the generated method copies the parameters of the
+    component's method, and if no method names are given, all public methods of `spec`
+    (including static and class methods) are forwarded.
+    """
+
+    def __init__(self, *methods, spec=None):
+        if not methods and spec is None:
+            raise TypeError("Name the methods to delegate, or pass spec= to delegate all public methods")
+        self.methods = methods or tuple(
+            name for name, value in vars(spec).items()
+            if (inspect.isfunction(value) or isinstance(value, (staticmethod, classmethod))) and not name.startswith("_")
+        )
+        self.spec = spec
+
+
+class Delegating(type):
+    """
+    The Delegating metaclass turns `delegate` markers into slots and forwarding methods.
+
+    For every `name = delegate(...)` in the class body it:
+
+    - removes the marker and adds `name` to `__slots__`, so the component is stored in a
+      fixed slot instead of a per-instance `__dict__` (declare any other attributes in
+      `__slots__` as usual). Classes without markers, such as a plain subclass, keep
+      their `__slots__` (or their `__dict__`) as written,
+    - generates one plain function per delegated method, which reads the component from
+      its slot on every call. Assigning a new component to the attribute therefore
+      switches all forwarding methods at once, without creating a new class.
+
+    Methods written by hand in the class body are never overwritten.
+    """
+
+    def __new__(metaclass, name, bases, namespace):
+        markers = {key: value for key, value in namespace.items() if isinstance(value, delegate)}
+        for attribute in markers:
+            del namespace[attribute]
+        if markers:
+            slots = namespace.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            namespace["__slots__"] = tuple(slots) + tuple(markers)
+        for attribute, marker in markers.items():
+            for method in marker.methods:
+                if method not in namespace:
+                    namespace[method] = _forwarder(name, attribute, method, marker.spec)
+        return super().__new__(metaclass, name, bases, namespace)
+
+
+def _forwarder(class_name, attribute, method, spec):
+    # Like `collections.namedtuple` and `dataclasses`, we generate the source of a small function
+    # and compile it (see `_codegen.py`), so the result is as fast as the hand-written version.
+    # The raw attribute tells a staticmethod, whose parameters are all real arguments, from a
+    # method whose first parameter is the component itself.
+    parameters = None
+    if spec is not None:
+        try:
+            parameters = copied_parameters(inspect.getattr_static(spec, method))
+        except AttributeError:
+            pass
+    function = compile_wrapper(
+        "def {method}({signature}):\n"
+        "    return {self}.{attribute}.{method}({rest})\n",
+        parameters,
+        method=method,
+        attribute=attribute,
+    )
+    function.__qualname__ = f"{class_name}.{method}"
+    function.__doc__ = f"Forwards to `self.{attribute}.{method}`."
+    return function
+
+
+class Engine:
+    """
+    The Engine class from the composition example.
+    """
+
+    def start(self):
+        return "Engine starts"
+
+    def stop(self):
+        return "Engine stops"
+
+
+class ElectricEngine:
+    """
+    Another component with the same methods, to show swapping at runtime.
+    """
+
+    def start(self):
+        return "Electric motor hums"
+
+    def stop(self):
+        return "Electric motor stops"
+
+
+class Car(metaclass=Delegating):
+    """
+    The Car class from the composition example, with generated delegation.
+
+    `start` and `stop` are generated from Engine's public methods, and the engine is
+    stored in a slot.
+    """
+
+    engine = delegate(spec=Engine)
+
+    def __init__(self, engine):
+        self.engine = engine
+
+
+class HandWrittenCar:
+    """
+    The Car class exactly as written in the composition example.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def start(self):
+        return self.engine.start()
+
+
+class GetattrCar:
+    """
+    A Car that forwards every unknown attribute to its engine with `__getattr__`.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def __getattr__(self, name):
+        return getattr(self.engine, name)
+
+
+if __name__ == "__main__":
+    car = Car(Engine())
+    print(car.start())
+    car.engine = ElectricEngine()  # Swap the component; the class stays the same
+    print(car.start(), car.stop())
+    print(Car.__slots__, hasattr(car, "__dict__"))
+    # Output:
+    # Engine starts
+    # Electric motor hums Electric motor stops
+    # ('engine',) False
+
+
+    # --- A fleet of a million cars ---
+    # Memory is measured in a separate build, because tracing allocations slows the build down.
+    # The time per `start()` call is the best of three passes over the whole fleet.
+    engine = Engine()
+    count = 1_000_000
+    for cls in (HandWrittenCar, Car, GetattrCar):
+        tracemalloc.start()
+        fleet = [cls(engine) for _ in range(count)]
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del fleet
+
+        start = time.perf_counter()
+        fleet = [cls(engine) for _ in range(count)]
+        created = time.perf_counter() - start
+
+        passes = []
+        for _ in range(3):
+            start = time.perf_counter()
+            for vehicle in fleet:
+                vehicle.start()
+            passes.append(time.perf_counter() - start)
+        print(f"{cls.__name__}: {used / count:.0f} bytes per car, built in {created * 1000:.0f} ms, "
+              f"{min(passes) / count * 1e9:.0f} ns per start()")
+        del fleet
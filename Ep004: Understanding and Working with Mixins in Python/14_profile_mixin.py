@@ -0,0 +1,358 @@
+import functools
+import inspect
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+if __package__:
+    from ._codegen import compile_wrapper, copied_parameters
+else:  # Run as a script from this folder
+    from _codegen import compile_wrapper, copied_parameters
+
+# The handlers in this example write their log lines here instead of printing them,
+# so we can call them many times without flooding the terminal.
+log_lines = []
+
+
+class LatencyHistogram:
+    """
+    The LatencyHistogram class counts latencies in fixed, logarithmic buckets.
+
+    Storing every measured latency would use memory for every call. Instead we count
+    how many calls fell into each bucket, like an HDR histogram: values below 32 ns get
+    a bucket each, and every higher power-of-two range (32-63, 64-127, ...) is split
+    into 16 equal buckets. The bucket width grows with the value, so the relative error
+    stays below about 6% from nanoseconds to hours, with fewer than a thousand buckets.
+    """
+
+    SUB_BUCKET_BITS = 4
+
+    def __init__(self):
+        self.counts = []
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @classmethod
+    def bucket_index(cls, value):
+        shift = max(value.bit_length() - cls.SUB_BUCKET_BITS - 1, 0)
+        return (shift << cls.SUB_BUCKET_BITS) + (value >> shift)
+
+    @classmethod
+    def bucket_start(cls, index):
+        shift = max((index >> cls.SUB_BUCKET_BITS) - 1, 0)
+        return (index - (shift << cls.SUB_BUCKET_BITS)) << shift
+
+    def record(self, value):
+        index = self.bucket_index(value)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percent):
+        # The start of the bucket that contains the requested rank.
+        if not self.count:
+            return None
+        rank = max(1, round(self.count * percent / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.bucket_start(index)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "samples": self.count,
+            "mean_ns": self.total / self.count if self.count else None,
+            "min_ns": self.min,
+            "p50_ns": self.percentile(50),
+            "p90_ns": self.percentile(90),
+            "p99_ns": self.percentile(99),
+            "max_ns": self.max,
+            "buckets": {self.bucket_start(index): count for index, count in enumerate(self.counts) if count},
+        }
+
+
+def _count_value(counter):
+    # The next number an `itertools.count` will return, i.e. how many were taken. Its repr is
+    # the only way to read it without taking one.
+    return int(repr(counter)[len("count("):-1])
+
+
+class ProfileMixin:
+    """
+    The ProfileMixin class measures how long selected methods take.
+
+    Like LogMixin, it adds a cross-cutting behaviour to any class. The methods to
+    profile are chosen in the class statement:
+
+        class FileHandler(ProfileMixin, LogMixin, profile=["open_file"], sample_every=10):
+            ...
+
+    Without `profile`, all public methods defined in the class body are profiled, plus the
+    ones a profiled base class profiles; static methods, class methods, properties and
+    nested classes are left alone. A subclass records its own statistics and inherits
+    `sample_every` unless it passes its own. Each
+    profiled method is replaced by a wrapper that counts every call and, for one call
+    out of every `sample_every`, measures the latency into a LatencyHistogram. Sampling
+    keeps the cost low enough to leave profiling on in production: a call that is not
+    sampled only takes the next number from the method's `itertools.count` (a single,
+    thread-safe C call) and checks it; the clock and the statistics are not touched.
+
+    Every thread records its samples into its own statistics, so threads never wait for
+    each other or for a lock while recording. `profile_snapshot()` merges the statistics of all
+    threads when someone asks for them, and `profile_snapshot_json()` exports them.
+
+    `disable_profiling()` puts the original methods back on the class, so a disabled
+    profiler costs nothing at all; `enable_profiling()` installs the wrappers again.
+    """
+
+    def __init_subclass__(cls, profile=None, sample_every=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if sample_every is None:
+            sample_every = getattr(cls, "_profile_sample_every", 1)
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        if profile is None:
+            profile = list(getattr(cls, "_profile_originals", {}))
+            profile += [
+                name for name, value in vars(cls).items()
+                if inspect.isfunction(value) and not name.startswith("_") and name not in profile
+            ]
+        originals = {}
+        for name in profile:
+            original = cls._unprofiled(name)
+            if not inspect.isfunction(original):
+                raise TypeError(f"{cls.__name__}.{name} is not a plain method and cannot be profiled")
+            originals[name] = original
+        cls._profile_originals = originals
+        cls._profile_sample_every = sample_every
+        cls._profile_ticks = {name: itertools.count() for name in originals}  # Calls so far
+        cls._profile_local = threading.local()
+        cls._profile_threads = []  # One {method name: LatencyHistogram} dictionary per thread
+        cls._profile_threads_lock = threading.Lock()
+        cls.enable_profiling()
+
+    @classmethod
+    def _unprofiled(cls, name):
+        # The method as it was defined, not the wrapper a profiled base class installed for it,
+        # so a subclass never wraps a wrapper.
+        for klass in cls.__mro__:
+            if name in vars(klass):
+                return vars(klass).get("_profile_originals", {}).get(name, vars(klass)[name])
+        raise AttributeError(f"{cls.__name__} has no method {name!r} to profile")
+
+    @classmethod
+    def enable_profiling(cls):
+        for name, function in cls._profile_originals.items():
+            setattr(cls, name, cls._profiled(name, function))
+
+    @classmethod
+    def disable_profiling(cls):
+        for name, function in cls._profile_originals.items():
+            setattr(cls, name, function)
+
+    @classmethod
+    def _thread_stats(cls):
+        # Called once per thread: registering the thread's dictionary is the only step that takes a lock.
+        stats = {name: LatencyHistogram() for name in cls._profile_originals}
+        cls._profile_local.stats = stats
+        with cls._profile_threads_lock:
+            cls._profile_threads.append(stats)
+        return stats
+
+    @classmethod
+    def _record(cls, name, latency):
+        # Only sampled calls get here.
+        try:
+            stats = cls._profile_local.stats
+        except AttributeError:
+            stats = cls._thread_stats()
+        stats[name].record(latency)
+
+    @classmethod
+    def _profiled(cls, name, function):
+        # The wrapper copies the wrapped method's parameters (see `_codegen.py`), because
+        # forwarding `*args, **kwargs` would cost more than the rest of the unsampled path.
+        wrapper = compile_wrapper(
+            "def {name}({signature}):\n"
+            "    if next({ticks}) % {sample_every}:\n"
+            "        return {function}({arguments})\n"
+            "    {start} = {clock}()\n"
+            "    try:\n"
+            "        return {function}({arguments})\n"
+            "    finally:\n"
+            "        {record}({method_name}, {clock}() - {start})\n",
+            copied_parameters(function),
+            {
+                "ticks": cls._profile_ticks[name],
+                "sample_every": cls._profile_sample_every,
+                "function": function,
+                "clock": time.perf_counter_ns,
+                "record": cls._record,
+                "method_name": name,
+            },
+            ["start"],
+            name=name,
+        )
+        return functools.wraps(function)(wrapper)
+
+    @classmethod
+    def profile_snapshot(cls):
+        with cls._profile_threads_lock:
+            threads = list(cls._profile_threads)
+        snapshot = {}
+        for name in cls._profile_originals:
+            histogram = LatencyHistogram()
+            for stats in threads:
+                histogram.merge(stats[name])
+            snapshot[name] = {
+                "calls": _count_value(cls._profile_ticks[name]),
+                "sample_every": cls._profile_sample_every,
+                **histogram.to_dict(),
+            }
+        return snapshot
+
+    @classmethod
+    def profile_snapshot_json(cls, **json_options):
+        return json.dumps({cls.__name__: cls.profile_snapshot()}, **json_options)
+
+
+class LogMixin:
+    """
+    The LogMixin class provides logging functionality that can be added to any class.
+    """
+
+    def log(self, message):
+        log_lines.append(f"Log: {message}")
+
+
+class SaveMixin:
+    """
+    The SaveMixin class from the MRO example.
+    """
+
+    def save(self, data):
+        log_lines.append(f"Saving data: {data}")
+
+
+class BackupMixin(SaveMixin):
+    """
+    The BackupMixin class from the MRO example.
+    """
+
+    def save(self, data):
+        super().save(data)
+        log_lines.append(f"Backing up data: {data}")
+
+
+class FileHandler(ProfileMixin, LogMixin):
+    """
+    The FileHandler class from the earlier examples, with every public method profiled.
+    """
+
+    def open_file(self, filename):
+        self.log(f"Opening file: {filename}")
+
+
+class NetworkHandler(ProfileMixin, LogMixin, profile=["connect"], sample_every=10):
+    """
+    The NetworkHandler class from the earlier examples. Only one call in ten is timed.
+    """
+
+    def connect(self, address):
+        self.log(f"Connecting to {address}")
+        time.sleep(0.0001)  # Stands in for the network round trip
+
+
+class DataHandler(ProfileMixin, LogMixin, BackupMixin, profile=["process_and_save", "save"]):
+    """
+    The DataHandler class from the MRO example. `save` is inherited from BackupMixin,
+    and is profiled as it resolves on DataHandler.
+    """
+
+    def process_and_save(self, data):
+        self.log(f"Processing data: {data}")
+        self.save(data)
+
+
+if __name__ == "__main__":
+    file_handler = FileHandler()
+    network_handler = NetworkHandler()
+    data_handler = DataHandler()
+
+    # Four threads use the handlers at the same time; each records into its own statistics.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for number in range(400):
+            executor.submit(file_handler.open_file, f"file_{number}.txt")
+            executor.submit(network_handler.connect, "192.168.1.1")
+            executor.submit(data_handler.process_and_save, number)
+
+    for handler_class in (FileHandler, NetworkHandler, DataHandler):
+        for method, stats in handler_class.profile_snapshot().items():
+            print(f"{handler_class.__name__}.{method}: {stats['calls']} calls, {stats['samples']} timed, "
+                  f"p50 {stats['p50_ns']} ns, p99 {stats['p99_ns']} ns")
+    print(NetworkHandler.profile_snapshot_json()[:80] + "...")
+
+
+    # --- Overhead per call ---
+    class PlainFileHandler(LogMixin):
+        """
+        FileHandler without profiling, as the baseline.
+        """
+
+        def open_file(self, filename):
+            self.log(f"Opening file: {filename}")
+
+
+    class SampledFileHandler(ProfileMixin, LogMixin, sample_every=100):
+        """
+        FileHandler with one call in a hundred timed.
+        """
+
+        def open_file(self, filename):
+            self.log(f"Opening file: {filename}")
+
+
+    calls = 200_000
+    for label, handler in [
+        ("not profiled", PlainFileHandler()),
+        ("profiled, every call", FileHandler()),
+        ("profiled, 1 in 100", SampledFileHandler()),
+    ]:
+        log_lines.clear()
+        start = time.perf_counter()
+        for _ in range(calls):
+            handler.open_file("example.txt")
+        print(f"{label}: {(time.perf_counter() - start) / calls * 1e9:.0f} ns per call")
+
+    FileHandler.disable_profiling()
+    log_lines.clear()
+    start = time.perf_counter()
+    for _ in range(calls):
+        file_handler.open_file("example.txt")
+    print(f"profiling disabled: {(time.perf_counter() - start) / calls * 1e9:.0f} ns per call")
+    log_lines.clear()
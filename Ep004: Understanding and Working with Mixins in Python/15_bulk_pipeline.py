@@ -0,0 +1,191 @@
+import queue
+import threading
+import time
+
+# The mixins in this example record what they do here instead of printing it.
+log_lines = []
+saved = []
+backed_up = []
+
+# A unique object that tells a stage there are no more records.
+_DONE = object()
+
+
+class StageStats:
+    """
+    The StageStats class holds the counters of one pipeline stage.
+
+    `busy_seconds` is the time the stage spent working on records (not waiting for
+    them), so `throughput` is the rate the stage could sustain on its own.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def throughput(self):
+        return self.processed / self.busy_seconds if self.busy_seconds else None
+
+    def __repr__(self):
+        rate = f"{self.throughput:,.0f}/s" if self.throughput else "n/a"
+        return f"<{self.name}: {self.processed} processed, {self.failed} failed, {rate}>"
+
+
+class LogMixin:
+    """
+    The LogMixin class provides logging functionality that can be added to any class.
+    """
+
+    def log(self, message):
+        log_lines.append(f"Log: {message}")
+
+
+class SaveMixin:
+    """
+    The SaveMixin class provides saving functionality.
+    """
+
+    def save(self, data):
+        if data is None:
+            raise ValueError("Cannot save an empty record")
+        time.sleep(0.0005)  # Stands in for a write to the main disk
+        saved.append(data)
+
+
+class BackupMixin(SaveMixin):
+    """
+    The BackupMixin class from the MRO example, with the backup moved into its own
+    `backup` method, so the pipeline can run it as a separate stage. `save` still
+    calls the `save` method from SaveMixin first and then backs up, as before, unless
+    the caller passes `backup=False` because it runs the backup itself, like the
+    pipeline's backup stage does.
+    """
+
+    def save(self, data, backup=True):
+        super().save(data)
+        if backup:
+            self.backup(data)
+
+    def backup(self, data):
+        time.sleep(0.0005)  # Stands in for a write to a slow backup disk
+        backed_up.append(data)
+
+
+class DataHandler(LogMixin, BackupMixin):
+    """
+    The DataHandler class from the MRO example, with a bulk API.
+
+    `process_and_save` handles one record at a time: log, then save, then back up, all
+    on the caller's thread. `process_and_save_many` streams many records through the
+    same three steps as a pipeline:
+
+    - each step (log, save, backup) is a stage running on its own thread,
+    - consecutive stages are connected by bounded queues, so a slow stage makes the
+      earlier ones wait instead of letting records pile up in memory,
+    - while the backup stage waits for the backup disk, the save stage already writes
+      the next record to the main disk, so the two disk-bound steps overlap,
+    - a record that fails in a stage is set aside with its error and does not go on to
+      the next stage; the rest of the batch keeps flowing.
+
+    It returns the per-stage StageStats and a list of (record, stage name, exception).
+    The stages call `log`, `save` and `backup` through `self`, so overrides of those
+    methods in a subclass or another mixin run in the pipeline as well. The save stage
+    calls `save(data, backup=False)`, so an override of `save` takes keyword options
+    and passes them on (`def save(self, data, **options)`).
+    """
+
+    def process_and_save(self, data):
+        self.log(f"Processing data: {data}")
+        self.save(data)
+
+    def pipeline_stages(self):
+        # The save stage calls the whole `save` chain, and tells BackupMixin's `save` to
+        # leave the backup to the backup stage.
+        return [
+            ("log", lambda data: self.log(f"Processing data: {data}")),
+            ("save", lambda data: self.save(data, backup=False)),
+            ("backup", self.backup),
+        ]
+
+    def process_and_save_many(self, records, queue_size=256):
+        stages = self.pipeline_stages()
+        queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+        stats = [StageStats(name) for name, _ in stages]
+        errors = []
+        errors_lock = threading.Lock()
+
+        def run_stage(position):
+            name, step = stages[position]
+            inbox = queues[position]
+            outbox = queues[position + 1] if position + 1 < len(queues) else None
+            stage_stats = stats[position]
+            clock = time.perf_counter
+            while True:
+                record = inbox.get()
+                if record is _DONE:
+                    if outbox is not None:
+                        outbox.put(_DONE)
+                    return
+                start = clock()
+                try:
+                    step(record)
+                except Exception as error:
+                    stage_stats.failed += 1
+                    with errors_lock:
+                        errors.append((record, name, error))
+                    continue
+                finally:
+                    stage_stats.busy_seconds += clock() - start
+                stage_stats.processed += 1
+                if outbox is not None:
+                    outbox.put(record)
+
+        workers = [threading.Thread(target=run_stage, args=(position,), daemon=True) for position in range(len(stages))]
+        for worker in workers:
+            worker.start()
+        try:
+            for record in records:
+                queues[0].put(record)
+        finally:
+            # Even if reading `records` fails, the stages are told to finish what they have.
+            queues[0].put(_DONE)
+            for worker in workers:
+                worker.join()
+        return stats, errors
+
+
+if __name__ == "__main__":
+    records = [f"record {number}" for number in range(400)]
+    records[7] = None  # This record fails in the save stage
+
+    data_handler = DataHandler()
+    stats, errors = data_handler.process_and_save_many(records)
+    for stage_stats in stats:
+        print(stage_stats)
+    print(errors)
+    print(f"Saved: {len(saved)}, backed up: {len(backed_up)}")
+    # Output (rates vary):
+    # <log: 400 processed, 0 failed, ...>
+    # <save: 399 processed, 1 failed, ...>
+    # <backup: 399 processed, 0 failed, ...>
+    # [(None, 'save', ValueError('Cannot save an empty record'))]
+    # Saved: 399, backed up: 399
+
+
+    # --- One record at a time versus the pipeline ---
+    good_records = [record for record in records if record is not None]
+
+    start = time.perf_counter()
+    for record in good_records:
+        data_handler.process_and_save(record)
+    serial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data_handler.process_and_save_many(good_records)
+    pipelined = time.perf_counter() - start
+
+    print(f"process_and_save: {len(good_records) / serial:,.0f} records/sec")
+    print(f"process_and_save_many: {len(good_records) / pipelined:,.0f} records/sec")
@@ -0,0 +1,349 @@
+import functools
+import gc
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+# The mixins in this example append what they do to this journal instead of printing it,
+# so we can check exactly which steps of the chain ran.
+journal = []
+
+# A unique object that marks "not in the cache", because None is a valid cached result.
+_MISSING = object()
+
+
+class CacheStats:
+    """
+    The CacheStats class counts what happened to the lookups of one cached method.
+
+    `evictions` counts entries dropped because the cache was full, `expirations` the
+    entries dropped because they were older than the time-to-live.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def to_dict(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class LRUCache:
+    """
+    The LRUCache class keeps at most `maxsize` results, dropping the least recently used.
+
+    Entries are kept in an OrderedDict: a hit moves the entry to the end, so the entry
+    at the front is always the one that was used longest ago. With a `ttl` (in seconds),
+    every entry also remembers when it expires, and an expired entry counts as a miss.
+
+    The cache itself does no locking; CacheMixin holds a lock around every call.
+    """
+
+    def __init__(self, stats, maxsize=128, ttl=None, clock=time.monotonic):
+        self.stats = stats
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        entry = self.entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self.stats.misses += 1
+            return _MISSING
+        value, expires = entry
+        if expires is not None and self.clock() >= expires:
+            del self.entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return _MISSING
+        self.entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def put(self, key, value):
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        self.entries[key] = (value, expires)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class CacheMixin:
+    """
+    The CacheMixin class remembers the results of selected methods.
+
+    Methods like `speak` or `Engine.start` always give the same result for the same
+    arguments, and saving the same payload twice does nothing new. The methods to cache
+    are chosen in the class statement:
+
+        class DataHandler(CacheMixin, LogMixin, BackupMixin, cache_methods=["save"]):
+            ...
+
+    Each listed method is resolved through the MRO as usual (here `save` comes from
+    BackupMixin) and replaced, on this class, by a wrapper that looks the arguments up
+    first. So the cache layer sits right above the method it caches: on a hit, nothing
+    further down the chain runs (neither BackupMixin's nor SaveMixin's `save`), while
+    methods that call the cached one, like `process_and_save`, still run every time.
+
+    Options:
+
+    - `cache_size`: the maximum number of results kept per cache (least recently used
+      results are dropped first),
+    - `cache_ttl`: optional number of seconds after which a result is computed again,
+    - `cache_scope`: "instance" gives every instance its own cache, "class" shares one
+      cache between all instances and leaves `self` out of the key (only correct when
+      the result does not depend on the instance, like `speak`).
+
+    Instance caches are keyed by `id(instance)`, not by the instance itself, so
+    instances that compare equal still get separate caches and instances without a
+    hash (a class with `__eq__` but no `__hash__`, like a dataclass) can be cached too.
+    A `weakref.finalize` per instance removes its cache when the instance is garbage
+    collected, so the cache never keeps an instance alive. All arguments must be
+    hashable; calls with unhashable arguments are passed through uncached. A lock per
+    method makes the caches safe to use from several threads; the method itself runs
+    outside the lock, so two threads that miss at the same time may both compute it.
+
+    `cache_info()` returns the hit, miss, eviction and expiration counts per method,
+    summed over all instances, and `cache_clear()` empties the caches.
+    """
+
+    def __init_subclass__(cls, cache_methods=(), cache_size=128, cache_ttl=None, cache_scope="instance", **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cache_scope not in ("instance", "class"):
+            raise ValueError("cache_scope must be 'instance' or 'class'")
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+        # The cached methods of the base classes stay visible to `cache_info` and `cache_clear`,
+        # even when a class in between declares its own `_cache_methods`.
+        merged = {}
+        for klass in reversed(cls.__mro__):
+            merged.update(vars(klass).get("_cache_methods", {}))
+        cls._cache_methods = merged
+        for name in cache_methods:
+            function = getattr(cls, name)
+            state = _CachedMethod(function, cache_size, cache_ttl, cache_scope)
+            cls._cache_methods[name] = state
+            setattr(cls, name, state.wrapper())
+
+    @classmethod
+    def cache_info(cls):
+        return {name: state.info() for name, state in cls._cache_methods.items()}
+
+    @classmethod
+    def cache_clear(cls):
+        for state in cls._cache_methods.values():
+            state.clear()
+
+
+class _CachedMethod:
+    # The caches, statistics and lock of one cached method of one class.
+
+    def __init__(self, function, maxsize, ttl, scope):
+        self.function = function
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.scope = scope
+        self.stats = CacheStats()
+        self.lock = threading.Lock()
+        if scope == "class":
+            self.shared = LRUCache(self.stats, maxsize, ttl)
+        else:
+            self.per_instance = {}  # id(instance) -> LRUCache
+
+    def cache_for(self, instance):
+        if self.scope == "class":
+            return self.shared
+        key = id(instance)
+        cache = self.per_instance.get(key)
+        if cache is None:
+            cache = self.per_instance[key] = LRUCache(self.stats, self.maxsize, self.ttl)
+            # The finalizer runs before the id can be reused by another object. It takes no lock:
+            # garbage collection may run it while this thread already holds `self.lock`.
+            weakref.finalize(instance, self.per_instance.pop, key, None)
+        return cache
+
+    def wrapper(self):
+        function = self.function
+        lock = self.lock
+        cache_for = self.cache_for
+
+        @functools.wraps(function)
+        def cached(self, *args, **kwargs):
+            key = (args, frozenset(kwargs.items())) if kwargs else args
+            try:
+                hash(key)
+            except TypeError:
+                return function(self, *args, **kwargs)
+            with lock:
+                cache = cache_for(self)
+                value = cache.get(key)
+            if value is not _MISSING:
+                return value
+            value = function(self, *args, **kwargs)
+            with lock:
+                cache.put(key, value)
+            return value
+
+        return cached
+
+    def info(self):
+        with self.lock:
+            caches = [self.shared] if self.scope == "class" else list(self.per_instance.values())
+            return {**self.stats.to_dict(), "size": sum(map(len, caches)), "caches": len(caches)}
+
+    def clear(self):
+        with self.lock:
+            # The caches are emptied rather than removed, so every instance keeps its one finalizer.
+            caches = [self.shared] if self.scope == "class" else list(self.per_instance.values())
+            for cache in caches:
+                cache.entries.clear()
+
+
+class LogMixin:
+    """
+    The LogMixin class from the MRO example.
+    """
+
+    def log(self, message):
+        journal.append(("log", message))
+
+
+class SaveMixin:
+    """
+    The SaveMixin class from the MRO example.
+    """
+
+    def save(self, data):
+        journal.append(("save", data))
+
+
+class BackupMixin(SaveMixin):
+    """
+    The BackupMixin class from the MRO example.
+    """
+
+    def save(self, data):
+        super().save(data)
+        journal.append(("backup", data))
+
+
+class DataHandler(CacheMixin, LogMixin, BackupMixin, cache_methods=["save"], cache_size=2):
+    """
+    The DataHandler class from the MRO example, with `save` cached: saving a payload
+    that was saved recently does not save or back it up again.
+    """
+
+    def process_and_save(self, data):
+        self.log(f"Processing data: {data}")
+        self.save(data)
+
+
+class Animal:
+    """
+    The Animal class from the inheritance example.
+    """
+
+    def speak(self):
+        return "Some generic animal sound"
+
+
+class Dog(CacheMixin, Animal, cache_methods=["speak"], cache_scope="class"):
+    """
+    The Dog class from the inheritance example, with a sound that takes a while to work
+    out. Every dog makes the same sound, so one cache is shared by the whole class.
+    """
+
+    def speak(self):
+        time.sleep(0.001)  # Stands in for an expensive computation
+        return "Woof!"
+
+
+class Engine(CacheMixin, cache_methods=["start"], cache_ttl=0.05):
+    """
+    The Engine class from the composition example. The result of `start` is reused for
+    50 ms, after which the engine is really started again.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def start(self):
+        journal.append(("start", self.name))
+        return f"{self.name} starts"
+
+
+if __name__ == "__main__":
+    # --- The cache layer sits right above BackupMixin.save in the chain (checked in tests/) ---
+    data_handler = DataHandler()
+    data_handler.process_and_save("Important data")
+    data_handler.process_and_save("Important data")  # Logging still runs; save and backup do not
+    print(journal)
+    # Output:
+    # [('log', 'Processing data: Important data'), ('save', 'Important data'), ('backup', 'Important data'), ('log', 'Processing data: Important data')]
+
+    # With room for two payloads, saving a third drops the least recently used one.
+    journal.clear()
+    for data in ["More data", "Important data", "Other data", "More data"]:
+        data_handler.save(data)
+    print(journal)
+    print(DataHandler.cache_info())
+    # Output:
+    # [('save', 'More data'), ('backup', 'More data'), ('save', 'Other data'), ('backup', 'Other data'), ('save', 'More data'), ('backup', 'More data')]
+    # {'save': {'hits': 2, 'misses': 4, 'evictions': 2, 'expirations': 0, 'hit_rate': 0.3333333333333333, 'size': 2, 'caches': 1}}
+
+    # Instance caches disappear with their instance.
+    del data_handler
+    gc.collect()
+    print(DataHandler.cache_info()["save"]["caches"])
+    # Output:
+    # 0
+
+
+    # --- Expiry ---
+    journal.clear()
+    engine = Engine("Engine")
+    engine.start()
+    engine.start()
+    time.sleep(0.06)
+    engine.start()
+    print(journal, Engine.cache_info()["start"]["expirations"])
+    # Output:
+    # [('start', 'Engine'), ('start', 'Engine')] 1
+
+
+    # --- Many threads, one shared cache ---
+    def bark(times):
+        dog = Dog()
+        for _ in range(times):
+            dog.speak()
+
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=bark, args=(10_000,)) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    info = Dog.cache_info()["speak"]
+    print(f"80,000 barks in {elapsed * 1000:.0f} ms, {info['misses']} computed, hit rate {info['hit_rate']:.4f}")
+    print(f"Without the cache: at least {80_000 * 0.001:.0f} seconds")
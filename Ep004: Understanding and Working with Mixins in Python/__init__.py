@@ -0,0 +1,81 @@
+"""
+The Ep004 mixin examples as a package, installed as `listen_and_learn_code.mixins`.
+
+The example files start with their episode number (`16_cache_mixin.py`), which is not a
+valid Python identifier, so they cannot be imported with a plain `import` statement. This
+package gives every file a name without the number (`mixins.cache_mixin`), and exports the
+main class of each later example by name (`from listen_and_learn_code.mixins import
+CacheMixin`).
+
+Nothing is imported up front: the module-level `__getattr__` imports an example the first
+time one of its names is used. Every example defines its own `LogMixin`, `SaveMixin`, etc.,
+so those are taken from the example module they belong to, e.g.
+`mixins.advanced_mixin_mro_example.DataHandler`.
+
+The demos only run when a file is executed directly, either from the episode folder
+(`python 16_cache_mixin.py`) or from the package
+(`python -m listen_and_learn_code.mixins.16_cache_mixin`).
+"""
+
+import importlib
+
+_SUBMODULES = {
+    "inheritance_example": "01_inheritance_example",
+    "composition_example": "02_composition_example",
+    "basic_mixin_example": "03_basic_mixin_example",
+    "mixin_vs_inheritance": "04_mixin_vs_inheritance",
+    "advanced_mixin_mro_example": "05_advanced_mixin_mro_example",
+    "queued_logging_mixin": "06_queued_logging_mixin",
+    "write_behind_save_mixin": "07_write_behind_save_mixin",
+    "deduplicated_backup_mixin": "08_deduplicated_backup_mixin",
+    "file_handle_pool": "09_file_handle_pool",
+    "connection_pool": "10_connection_pool",
+    "mixin_composition_factory": "11_mixin_composition_factory",
+    "population_store": "12_population_store",
+    "delegation_generator": "13_delegation_generator",
+    "profile_mixin": "14_profile_mixin",
+    "bulk_pipeline": "15_bulk_pipeline",
+    "cache_mixin": "16_cache_mixin",
+}
+
+_EXPORTS = {
+    "QueuedLogBackend": "queued_logging_mixin",
+    "WriteBehindStore": "write_behind_save_mixin",
+    "DedupBackupStore": "deduplicated_backup_mixin",
+    "FileHandlePool": "file_handle_pool",
+    "AsyncConnectionPool": "connection_pool",
+    "ConnectionPool": "connection_pool",
+    "EchoServer": "connection_pool",
+    "after_super": "mixin_composition_factory",
+    "before_super": "mixin_composition_factory",
+    "compose": "mixin_composition_factory",
+    "flatten_method": "mixin_composition_factory",
+    "AnimalView": "population_store",
+    "Population": "population_store",
+    "Delegating": "delegation_generator",
+    "delegate": "delegation_generator",
+    "LatencyHistogram": "profile_mixin",
+    "ProfileMixin": "profile_mixin",
+    "StageStats": "bulk_pipeline",
+    "CacheMixin": "cache_mixin",
+    "CacheStats": "cache_mixin",
+    "LRUCache": "cache_mixin",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = importlib.import_module(f".{_SUBMODULES[name]}", __name__)
+    elif name in _EXPORTS:
+        value = getattr(__getattr__(_EXPORTS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Stored as a regular global, so `__getattr__` is only called once per name.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULES))
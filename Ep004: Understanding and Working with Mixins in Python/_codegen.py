@@ -0,0 +1,88 @@
+"""
+Generated wrapper functions, shared by `11_mixin_composition_factory.py`,
+`13_delegation_generator.py` and `14_profile_mixin.py`.
+
+Those examples build small functions that call another method with their own
+arguments. Like `collections.namedtuple` and `dataclasses`, they generate the source
+and compile it with `exec`: a wrapper that repeats the wrapped method's parameter
+names can pass them on as plain positional arguments, which costs about half as much
+as forwarding `*args, **kwargs`.
+
+The generated code also needs names of its own: helpers such as the wrapped function
+or a clock, which are passed in as globals, and local variables. A fixed name like
+`_step` would be shadowed by a parameter of the same name, so `compile_wrapper` picks
+every such name after it knows the parameters, and none of them can clash.
+"""
+
+import inspect
+
+
+def copied_parameters(method):
+    """
+    Returns the names of the parameters a wrapper for `method` can copy, without the
+    instance (or class) parameter, or None when they cannot be copied.
+
+    `method` is the raw attribute from the class `__dict__` (see `inspect.getattr_static`):
+    a plain function or classmethod loses its first parameter, a staticmethod keeps all
+    of them. Only positional-or-keyword parameters without defaults are copied; anything
+    else (defaults, `*args`, keyword-only parameters) makes the wrapper fall back to
+    `*args, **kwargs`.
+    """
+    if isinstance(method, staticmethod):
+        function, skip = method.__func__, 0
+    elif isinstance(method, classmethod):
+        function, skip = method.__func__, 1
+    elif inspect.isfunction(method):
+        function, skip = method, 1
+    else:
+        return None
+    parameters = list(inspect.signature(function).parameters.values())[skip:]
+    if all(parameter.kind is parameter.POSITIONAL_OR_KEYWORD and parameter.default is parameter.empty
+           for parameter in parameters):
+        return [parameter.name for parameter in parameters]
+    return None
+
+
+def compile_wrapper(template, parameters, helpers=None, local_names=(), **text):
+    """
+    Compiles the function in `template` and returns it.
+
+    The template is a `str.format` string with these fields:
+
+    - `{self}`: the name of the instance parameter,
+    - `{signature}`: the whole parameter list, starting with the instance,
+    - `{arguments}`: the same names as call arguments, and `{rest}` the ones after the instance,
+    - one field per key of `helpers`: the name of a global bound to that value,
+    - one field per entry of `local_names`: the name of a local variable,
+    - any other field: the string passed for it in `text` (a method name, for example).
+
+    `parameters` comes from `copied_parameters`; None means `*args, **kwargs`.
+    """
+    if parameters is None:
+        rest, taken = "*args, **kwargs", {"args", "kwargs"}
+    else:
+        rest, taken = ", ".join(parameters), set(parameters)
+    fields = dict(text)
+
+    def choose(base):
+        # `base` itself when it is free, otherwise with as many trailing underscores as it takes.
+        name = base
+        while name in taken or name in fields.values():
+            name += "_"
+        taken.add(name)
+        return name
+
+    fields["self"] = choose("self")
+    namespace = {}
+    for key, value in (helpers or {}).items():
+        fields[key] = choose(f"_{key}")
+        namespace[fields[key]] = value
+    for key in local_names:
+        fields[key] = choose(f"_{key}")
+    fields["rest"] = rest
+    fields["arguments"] = f"{fields['self']}, {rest}" if rest else fields["self"]
+    fields["signature"] = fields["arguments"]
+    source = template.format(**fields)
+    exec(source, namespace)
+    function_name = source.split("def ", 1)[1].split("(", 1)[0]
+    return namespace[function_name]
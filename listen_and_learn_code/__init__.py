@@ -0,0 +1,25 @@
+# Listen&Learn Code
+# -----------------
+# The podcast's code examples as one installable package:
+# - `listen_and_learn_code.iterator`: the Iterator design pattern examples (`DesignPatterns/Iterator`),
+# - `listen_and_learn_code.mixins`: the Ep004 mixin examples.
+#
+# The subpackages are imported on first use by the module-level `__getattr__`, so
+# `import listen_and_learn_code` costs next to nothing. `python -m listen_and_learn_code.import_budget`
+# checks that it stays that way.
+
+import importlib
+
+_SUBPACKAGES = ("iterator", "mixins")
+
+__all__ = list(_SUBPACKAGES)
+
+
+def __getattr__(name):
+    if name not in _SUBPACKAGES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBPACKAGES))
@@ -0,0 +1,94 @@
+# Import-Time Budget
+# ------------------
+# Importing the package should cost (almost) nothing until an example is actually used. This check
+# guards that: it runs the import statement in a fresh interpreter, which times the statement itself
+# with `time.perf_counter_ns()` and reports it together with the names in `sys.modules`.
+#
+# `python -X importtime` is not used: it only reports `import` statements, so modules that the
+# packages' `__getattr__` loads with `importlib.import_module` would neither be timed nor be seen
+# by the dependency check. The check fails (exit status 1) when the median over `--runs` runs
+# exceeds `--budget-ms`, or when a heavy optional dependency (NumPy, more_itertools) was imported.
+#
+# The subpackages only exist in an installed copy: `pyproject.toml` maps the episode folders to
+# `listen_and_learn_code.iterator` and `.mixins`, and the checkout's `listen_and_learn_code/` folder does
+# not contain them. The fresh interpreter therefore runs in a temporary directory, so the checkout
+# cannot shadow the installed copy, and the check stops with a hint when the package is not installed.
+# Run it after installing the package, e.g. in CI:
+#     pip install . && python -m listen_and_learn_code.import_budget --budget-ms 10
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PACKAGE = "listen_and_learn_code"
+
+DEFAULT_STATEMENT = (
+    f"import {PACKAGE}.iterator, {PACKAGE}.mixins; "
+    f"from {PACKAGE}.iterator import MyIterator, process_collection"
+)
+
+FORBIDDEN_MODULES = ("numpy", "more_itertools")
+
+
+def measure(statement=DEFAULT_STATEMENT):
+    # Returns (microseconds the statement took, names of all modules loaded in the process).
+    timed = (
+        "import json, sys, time\n"
+        "_start = time.perf_counter_ns()\n"
+        f"exec({statement!r})\n"
+        "_total_us = (time.perf_counter_ns() - _start) // 1000\n"
+        "print(json.dumps([_total_us, sorted(sys.modules)]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", timed],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tempfile.gettempdir(),  # Not the checkout, see the comment at the top
+    )
+    # The last line, in case the statement printed something itself.
+    total_us, modules = json.loads(result.stdout.splitlines()[-1])
+    return total_us, set(modules)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fail when a cold import of the package exceeds a time budget.")
+    parser.add_argument("--budget-ms", type=float, default=10.0, help="allowed median import time in milliseconds")
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh interpreters to measure")
+    parser.add_argument("--statement", default=DEFAULT_STATEMENT, help="the import statement to measure")
+    parser.add_argument("--allow", action="append", default=[], metavar="MODULE",
+                        help="a heavy dependency the statement is allowed to import (repeatable)")
+    options = parser.parse_args(argv)
+
+    timings = []
+    imported = set()
+    for _ in range(options.runs):
+        try:
+            total_us, modules = measure(options.statement)
+        except subprocess.CalledProcessError as error:
+            print(error.stderr, end="", file=sys.stderr)
+            print(f"FAIL: the statement could not run; is {PACKAGE} installed (pip install .)?", file=sys.stderr)
+            return 1
+        timings.append(total_us / 1000)
+        imported |= modules
+    median_ms = statistics.median(timings)
+    print(f"{options.statement}")
+    print(f"median {median_ms:.2f} ms over {options.runs} runs (budget {options.budget_ms:.2f} ms), "
+          f"min {min(timings):.2f} ms, max {max(timings):.2f} ms")
+
+    failures = []
+    if median_ms > options.budget_ms:
+        failures.append(f"import took {median_ms:.2f} ms, more than the budget of {options.budget_ms:.2f} ms")
+    for module in FORBIDDEN_MODULES:
+        if module in imported and module not in options.allow:
+            failures.append(f"{module} was imported; pass --allow {module} if the statement needs it")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The examples import their neighbours the way they do when run as scripts from their folder,
+# and the Ep004 file names start with a number, so the tests import them with `importlib`.
+for folder in ("DesignPatterns/Iterator", "Ep004: Understanding and Working with Mixins in Python"):
+    sys.path.insert(0, str(ROOT / folder))
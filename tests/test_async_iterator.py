@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from async_iterator import MyAsyncIterator, process_collection_async
+
+
+def test_async_iterator_yields_every_item():
+    async def collect():
+        return [item async for item in MyAsyncIterator([1, 2, 3])]
+
+    assert asyncio.run(collect()) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+@pytest.mark.parametrize("queue_size", [0, 1, 16])
+def test_every_item_is_handled_once(concurrency, queue_size):
+    batches = []
+
+    async def handler(batch):
+        await asyncio.sleep(0)
+        batches.append(batch)
+
+    processed = asyncio.run(
+        process_collection_async(range(100), handler, concurrency=concurrency, queue_size=queue_size, batch_size=8)
+    )
+    assert processed == 100
+    assert sorted(item for batch in batches for item in batch) == list(range(100))
+    assert all(1 <= len(batch) <= 8 for batch in batches)
+
+
+def test_handler_failure_is_raised():
+    def handler(batch):
+        raise RuntimeError("handler failed")
+
+    with pytest.raises(RuntimeError, match="handler failed"):
+        asyncio.run(process_collection_async(range(10), handler))
+
+
+@pytest.mark.parametrize(
+    "option, message",
+    [
+        ({"concurrency": 0}, "Concurrency must be at least 1"),
+        ({"batch_size": 0}, "Batch size must be at least 1"),
+        ({"queue_size": -1}, "Queue size must not be negative"),
+    ],
+)
+def test_invalid_options_are_rejected(option, message):
+    with pytest.raises(ValueError, match=message):
+        asyncio.run(asyncio.wait_for(process_collection_async([1, 2], lambda batch: None, **option), 5))
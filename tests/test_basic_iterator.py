@@ -0,0 +1,28 @@
+from array import array
+
+import pytest
+
+from basic_iterator_vs_for_loop import MyIterator
+
+
+def test_buffer_batches_are_memoryviews():
+    numbers = array("i", range(5))
+    batches = list(MyIterator(numbers).batches(2))
+    assert all(isinstance(batch, memoryview) for batch in batches)
+    assert [batch.tolist() for batch in batches] == [[0, 1], [2, 3], [4]]
+
+
+def test_other_collections_are_sliced():
+    assert list(MyIterator("abcde").batches(2)) == ["ab", "cd", "e"]
+
+
+@pytest.mark.parametrize("values, dtype", [
+    (["2020-01-01", "2021-01-01", "2022-01-01"], "datetime64[D]"),  # No buffer format
+    ([1, "a", None], object),  # Memoryviews of object arrays cannot be read
+])
+def test_numpy_batches_are_array_views(values, dtype):
+    np = pytest.importorskip("numpy")
+    data = np.array(values, dtype=dtype)
+    batches = list(MyIterator(data).batches(2))
+    assert [batch.tolist() for batch in batches] == [data[:2].tolist(), data[2:].tolist()]
+    assert np.shares_memory(batches[0], data)
@@ -0,0 +1,36 @@
+import ctypes
+from array import array
+
+import pytest
+
+from buffer_chunked import chunked_views
+
+
+def test_buffer_chunks_share_memory():
+    data = bytearray(b"abcdefgh")
+    first, second = chunked_views(data, 4)
+    data[0] = ord("z")
+    assert bytes(first) == b"zbcd" and bytes(second) == b"efgh"
+
+
+@pytest.mark.parametrize(
+    "data, fill_value, last",
+    [
+        (array("d", [1.0, 2.0, 3.0]), -1.0, [3.0, -1.0]),
+        (array("q", [1, 2, 3]), 0, [3, 0]),
+        (memoryview(b"abc").cast("c"), 0, [b"c", b"\x00"]),
+        (memoryview(b"abc").cast("c"), b"-", [b"c", b"-"]),
+        (memoryview(bytes([1, 0, 1])).cast("?"), False, [True, False]),
+    ],
+)
+def test_last_chunk_is_padded_in_the_buffer_format(data, fill_value, last):
+    *_, tail = chunked_views(data, 2, pad=True, fill_value=fill_value)
+    assert tail.format == memoryview(data).format
+    assert tail.tolist() == last
+
+
+def test_formats_that_cannot_be_padded_are_rejected():
+    data = (ctypes.c_int * 3)(1, 2, 3)  # Format '<i', which a memoryview cannot cast to
+    with pytest.raises(ValueError, match="Cannot pad buffers"):
+        list(chunked_views(data, 2, pad=True))
+    assert [len(chunk) for chunk in chunked_views(data, 2, drop_last=True)] == [2]
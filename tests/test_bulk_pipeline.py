@@ -0,0 +1,38 @@
+import importlib
+
+pipeline = importlib.import_module("15_bulk_pipeline")
+
+
+def _clear():
+    for records in (pipeline.log_lines, pipeline.saved, pipeline.backed_up):
+        records.clear()
+
+
+def test_pipeline_saves_and_backs_up_every_record_once():
+    _clear()
+    stats, errors = pipeline.DataHandler().process_and_save_many(["a", None, "b"])
+    assert [(stage.name, stage.processed, stage.failed) for stage in stats] == [
+        ("log", 3, 0), ("save", 2, 1), ("backup", 2, 0),
+    ]
+    assert [(record, stage) for record, stage, _ in errors] == [(None, "save")]
+    assert sorted(pipeline.saved) == sorted(pipeline.backed_up) == ["a", "b"]
+
+
+def test_pipeline_runs_overrides_of_save():
+    class Audit(pipeline.SaveMixin):
+        def save(self, data, **options):
+            pipeline.log_lines.append(f"audit {data}")
+            super().save(data, **options)
+
+    class Handler(pipeline.DataHandler, Audit):
+        def save(self, data, **options):
+            super().save(data.upper(), **options)
+
+    _clear()
+    Handler().process_and_save_many(["a"])
+    assert pipeline.saved == ["A"] and pipeline.backed_up == ["a"]
+    assert "audit A" in pipeline.log_lines
+
+    _clear()
+    Handler().process_and_save("b")  # Outside the pipeline, save still backs up itself
+    assert pipeline.saved == ["B"] and pipeline.backed_up == ["B"]
@@ -0,0 +1,89 @@
+import dataclasses
+import gc
+import importlib
+import threading
+import time
+
+caching = importlib.import_module("16_cache_mixin")
+
+
+def test_cache_layer_sits_right_above_backup_save():
+    assert [klass.__name__ for klass in caching.DataHandler.__mro__] == [
+        "DataHandler", "CacheMixin", "LogMixin", "BackupMixin", "SaveMixin", "object",
+    ]
+    assert "save" in vars(caching.DataHandler)
+    assert caching.DataHandler.save.__wrapped__ is caching.BackupMixin.save
+
+
+def test_cached_save_skips_save_and_backup_but_not_logging():
+    caching.journal.clear()
+    handler = caching.DataHandler()
+    handler.process_and_save("Important data")
+    handler.process_and_save("Important data")
+    assert caching.journal == [
+        ("log", "Processing data: Important data"),
+        ("save", "Important data"),
+        ("backup", "Important data"),
+        ("log", "Processing data: Important data"),
+    ]
+
+
+def test_least_recently_used_result_is_evicted():
+    caching.journal.clear()
+    handler = caching.DataHandler()
+    for data in ["a", "b", "a", "c", "b"]:  # Room for two: "c" evicts "b"
+        handler.save(data)
+    assert [data for step, data in caching.journal if step == "save"] == ["a", "b", "c", "b"]
+
+
+def test_expired_results_are_computed_again():
+    caching.journal.clear()
+    engine = caching.Engine("test engine")
+    engine.start()
+    engine.start()
+    time.sleep(0.06)
+    engine.start()
+    assert caching.journal == [("start", "test engine")] * 2
+
+
+def test_instance_caches_are_dropped_with_their_instance():
+    @dataclasses.dataclass
+    class Point(caching.CacheMixin, cache_methods=["norm"]):
+        x: int  # A dataclass has __eq__ but no __hash__
+
+        def norm(self):
+            return abs(self.x)
+
+    first, second = Point(1), Point(1)
+    assert first.norm() == second.norm() == 1
+    assert Point.cache_info()["norm"]["caches"] == 2  # Equal instances, separate caches
+    del first
+    gc.collect()
+    assert Point.cache_info()["norm"]["caches"] == 1
+
+
+def test_subclasses_keep_the_cached_methods_of_their_bases():
+    class Base(caching.CacheMixin, cache_methods=["value"]):
+        def value(self):
+            return 1
+
+    class Sub(Base, cache_methods=["other"]):
+        _cache_methods = {}
+
+        def other(self):
+            return 2
+
+    assert set(Sub.cache_info()) == {"value", "other"}
+    assert set(Base.cache_info()) == {"value"}
+
+
+def test_shared_cache_counts_every_call_from_many_threads():
+    caching.Dog.cache_clear()
+    before = caching.Dog.cache_info()["speak"]
+    workers = [threading.Thread(target=lambda: [caching.Dog().speak() for _ in range(500)]) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    info = caching.Dog.cache_info()["speak"]
+    assert info["hits"] + info["misses"] - before["hits"] - before["misses"] == 2000
@@ -0,0 +1,53 @@
+import asyncio
+import importlib
+import socket
+
+import pytest
+
+pooling = importlib.import_module("10_connection_pool")
+
+
+def test_request_raises_when_the_server_hangs_up():
+    client, server = socket.socketpair()
+    with client:
+        server.close()
+        with pytest.raises(ConnectionError):
+            pooling._request(client)
+
+
+def test_closed_connection_is_discarded():
+    with pooling.EchoServer() as server:
+        pool = pooling.ConnectionPool(server.address, min_size=0)
+        with pytest.raises(ConnectionError):
+            with pool.connection() as sock:
+                sock.shutdown(socket.SHUT_RD)  # Reads now see end of file, like after a server hang-up
+                pooling._request(sock)
+        assert pool.discarded == 1
+        with pool.connection() as sock:
+            assert pooling._request(sock, b"again\n") == b"again\n"
+        pool.close()
+
+
+def test_min_size_is_opened_again_after_a_failure(monkeypatch):
+    async def scenario(address):
+        pool = pooling.AsyncConnectionPool(address, min_size=2)
+        connect = pool._connect
+        attempts = []
+
+        async def flaky_connect():
+            attempts.append(None)
+            if len(attempts) == 2:
+                raise ConnectionRefusedError("refused")
+            return await connect()
+
+        monkeypatch.setattr(pool, "_connect", flaky_connect)
+        with pytest.raises(ConnectionRefusedError):
+            await pool.acquire()
+        streams = await pool.acquire()
+        await pool.release(streams)
+        await pool.close()
+        return pool
+
+    with pooling.EchoServer() as server:
+        pool = asyncio.run(scenario(server.address))
+    assert pool.created == 2 and pool.reused == 1
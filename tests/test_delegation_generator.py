@@ -0,0 +1,60 @@
+import importlib
+
+delegation = importlib.import_module("13_delegation_generator")
+
+
+class Gearbox:
+    def shift(self, gear):
+        return f"gear {gear}"
+
+    @staticmethod
+    def ratio(gear):
+        return 1 / gear
+
+    @classmethod
+    def kind(cls, suffix):
+        return cls.__name__ + suffix
+
+    class Part:
+        pass
+
+
+class Car(metaclass=delegation.Delegating):
+    gearbox = delegation.delegate(spec=Gearbox)
+
+    def __init__(self, gearbox):
+        self.gearbox = gearbox
+
+
+def test_all_kinds_of_methods_are_forwarded_with_their_arguments():
+    car = Car(Gearbox())
+    assert car.shift(3) == "gear 3"
+    assert car.ratio(4) == 0.25
+    assert car.kind("!") == "Gearbox!"
+    assert not hasattr(Car, "Part")
+
+
+def test_parameter_named_like_the_instance():
+    class Static:
+        @staticmethod
+        def echo(self):
+            return self
+
+    class Holder(metaclass=delegation.Delegating):
+        part = delegation.delegate(spec=Static)
+
+    holder = Holder()
+    holder.part = Static()
+    assert holder.echo("value") == "value"
+
+
+def test_only_classes_with_markers_get_slots():
+    assert Car.__slots__ == ("gearbox",)
+
+    class SportsCar(Car):
+        pass
+
+    car = SportsCar(Gearbox())
+    car.colour = "red"  # A plain subclass keeps its __dict__
+    assert car.colour == "red" and car.shift(1) == "gear 1"
+    assert "__slots__" not in vars(SportsCar)
@@ -0,0 +1,53 @@
+import importlib
+import threading
+
+import pytest
+
+pooling = importlib.import_module("09_file_handle_pool")
+
+
+@pytest.fixture
+def paths(tmp_path):
+    paths = []
+    for number in range(3):
+        path = tmp_path / f"file_{number}.txt"
+        path.write_text(f"file {number}")
+        paths.append(str(path))
+    return paths
+
+
+def test_borrowed_handles_count_against_the_budget(paths):
+    pool = pooling.FileHandlePool(max_handles=2, timeout=0.05)
+    first, second = pool.acquire(paths[0]), pool.acquire(paths[1])
+    with pytest.raises(TimeoutError):
+        pool.acquire(paths[2])
+    assert pool.stats()["open"] == 2
+    pool.release(first)
+    third = pool.acquire(paths[2])  # Evicts the idle handle of the first file
+    assert first.closed and pool.stats()["evictions"] == 1
+    pool.release(second)
+    pool.release(third)
+    pool.close()
+
+
+def test_waiting_caller_gets_the_released_slot(paths):
+    pool = pooling.FileHandlePool(max_handles=1, timeout=5)
+    borrowed = pool.acquire(paths[0])
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(pool.acquire(paths[1]).read()))
+    waiter.start()
+    pool.release(borrowed)
+    waiter.join()
+    assert results == ["file 1"]
+    assert pool.stats()["open"] == 1
+
+
+def test_releasing_a_foreign_handle_is_a_clear_error(paths):
+    pool = pooling.FileHandlePool()
+    handle = pool.acquire(paths[0])
+    pool.release(handle)
+    with pytest.raises(ValueError, match="not lent by this pool"):
+        pool.release(handle)
+    with open(paths[1]) as foreign, pytest.raises(ValueError, match="not lent by this pool"):
+        pool.release(foreign)
+    pool.close()
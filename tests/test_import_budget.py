@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+
+from listen_and_learn_code.import_budget import FORBIDDEN_MODULES, main, measure
+
+
+def _make_package(tmp_path, monkeypatch):
+    # A package whose submodule is loaded lazily, the way the real subpackages do it.
+    package = tmp_path / "slowpkg"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "import importlib\n"
+        "def __getattr__(name):\n"
+        "    return importlib.import_module('.' + name, __name__)\n"
+    )
+    (package / "slow.py").write_text("import time\ntime.sleep(0.05)\nVALUE = 1\n")
+    # Stands in for the real more_itertools, which the check must notice.
+    (package / "heavy.py").write_text("import more_itertools\n")
+    (tmp_path / "more_itertools.py").write_text("")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+
+
+def test_measure_includes_submodules_loaded_by_import_module(tmp_path, monkeypatch):
+    _make_package(tmp_path, monkeypatch)
+    total_us, imported = measure("import slowpkg; slowpkg.slow.VALUE")
+    assert total_us >= 50_000
+    assert "slowpkg.slow" in imported
+
+
+def test_measure_ignores_output_of_the_statement(tmp_path, monkeypatch):
+    _make_package(tmp_path, monkeypatch)
+    total_us, imported = measure("print('hello'); import slowpkg")
+    assert total_us < 50_000
+    assert "slowpkg" in imported and "slowpkg.slow" not in imported
+
+
+def test_main_fails_over_budget(tmp_path, monkeypatch):
+    _make_package(tmp_path, monkeypatch)
+    statement = "import slowpkg; slowpkg.slow"
+    assert main(["--runs", "1", "--budget-ms", "10", "--statement", statement]) == 1
+    assert main(["--runs", "1", "--budget-ms", "1000", "--statement", statement]) == 0
+
+
+def test_main_fails_on_lazily_imported_forbidden_module(tmp_path, monkeypatch):
+    _make_package(tmp_path, monkeypatch)
+    statement = "import slowpkg; slowpkg.heavy"
+    assert main(["--runs", "1", "--budget-ms", "1000", "--statement", statement]) == 1
+    assert main(["--runs", "1", "--budget-ms", "1000", "--statement", statement,
+                 "--allow", "more_itertools"]) == 0
+
+
+@pytest.fixture
+def installed_layout(tmp_path, monkeypatch):
+    # The package as `pip install .` lays it out, built from symlinks to the checkout by following
+    # the `package-dir` table of pyproject.toml, so the check runs without installing anything.
+    tomllib = pytest.importorskip("tomllib")
+    root = Path(__file__).resolve().parent.parent
+    with open(root / "pyproject.toml", "rb") as file:
+        package_dirs = tomllib.load(file)["tool"]["setuptools"]["package-dir"]
+    for package, source in sorted(package_dirs.items()):
+        target = tmp_path.joinpath(*package.split("."))
+        if "." in package:
+            target.symlink_to(root / source, target_is_directory=True)
+        else:
+            target.mkdir()
+            for module in (root / source).glob("*.py"):
+                (target / module.name).symlink_to(module)
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+
+
+def test_package_import_stays_within_budget(installed_layout):
+    assert main(["--runs", "5"]) == 0
+
+
+def test_package_import_loads_no_heavy_dependency(installed_layout):
+    _, imported = measure()
+    assert not imported & set(FORBIDDEN_MODULES)
+    # Using one light example loads that module only.
+    _, imported = measure("from listen_and_learn_code.iterator import count; count(range(10))")
+    assert "listen_and_learn_code.iterator.counting" in imported
+    assert not imported & set(FORBIDDEN_MODULES)
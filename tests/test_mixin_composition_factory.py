@@ -0,0 +1,65 @@
+import importlib
+
+import pytest
+
+factory = importlib.import_module("11_mixin_composition_factory")
+
+
+def test_compose_caches_classes():
+    mixins = (factory.ProcessMixin, factory.LogMixin, factory.BackupMixin)
+    assert factory.compose(*mixins) is factory.compose(*mixins)
+    assert factory.compose(*mixins, flatten=["save"]) is not factory.compose(*mixins)
+
+
+@pytest.mark.parametrize("handler_class", [
+    factory.DataHandler,
+    factory.compose(factory.ProcessMixin, factory.LogMixin, factory.BackupMixin),
+    factory.compose(factory.ProcessMixin, factory.LogMixin, factory.BackupMixin, flatten=["save"]),
+])
+def test_composed_and_flattened_classes_match_the_mro(handler_class):
+    assert factory.run(handler_class()) == factory.run(factory.ClassicDataHandler())
+
+
+def test_flattened_before_and_after_steps_match_the_mro():
+    mixins = (factory.ProcessMixin, factory.AuditMixin, factory.LogMixin, factory.BackupMixin)
+    flat = factory.compose(*mixins, flatten=["save"])
+    assert factory.run(flat()) == factory.run(factory.compose(*mixins)())
+    assert [step.__qualname__ for step in flat.save.__flattened__] == [
+        "AuditMixin.save", "SaveMixin.save", "BackupMixin.save",
+    ]
+
+
+def test_parameters_may_use_the_names_of_generated_helpers():
+    calls = []
+
+    class Base:
+        def save(self, _step, _result):
+            return ("saved", _step, _result)
+
+    class After(Base):
+        @factory.after_super
+        def save(self, _step, _result):
+            calls.append(("after", _step, _result))
+
+    class Before(After):
+        @factory.before_super
+        def save(self, _step, _result):
+            calls.append(("before", _step, _result))
+
+    assert Before().save(1, 2) == ("saved", 1, 2)
+    flat = factory.flatten_method(Before, "save")
+    assert flat(Before(), 3, 4) == ("saved", 3, 4)
+    assert calls == [("before", 1, 2), ("after", 1, 2), ("before", 3, 4), ("after", 3, 4)]
+
+
+def test_steps_with_defaults_fall_back_to_forwarding():
+    class Base:
+        def save(self, data, copies=1):
+            return data * copies
+
+    class Doubled(Base):
+        @factory.after_super
+        def save(self, data, copies=1):
+            pass
+
+    assert Doubled().save("ab", copies=2) == "abab"
@@ -0,0 +1,62 @@
+import importlib
+
+import pytest
+
+profiling = importlib.import_module("14_profile_mixin")
+
+
+def test_parameters_may_use_the_names_of_generated_helpers():
+    class Worker(profiling.ProfileMixin):
+        def work(self, _start, _clock, self_):
+            return (_start, _clock, self_)
+
+    assert Worker().work(1, 2, 3) == (1, 2, 3)
+    assert Worker.profile_snapshot()["work"]["samples"] == 1
+
+
+def test_sampling_counts_every_call_and_times_some():
+    class Worker(profiling.ProfileMixin, sample_every=10):
+        def work(self, value):
+            return value
+
+    worker = Worker()
+    assert [worker.work(number) for number in range(25)] == list(range(25))
+    snapshot = Worker.profile_snapshot()["work"]
+    assert (snapshot["calls"], snapshot["samples"]) == (25, 3)
+
+
+def test_only_plain_methods_are_profiled_by_default():
+    class Worker(profiling.ProfileMixin):
+        def work(self):
+            return "work"
+
+        @staticmethod
+        def helper(value):
+            return value
+
+        class Nested:
+            pass
+
+    assert list(Worker._profile_originals) == ["work"]
+    assert Worker.helper(1) == Worker().helper(1) == 1
+    with pytest.raises(TypeError):
+        class Broken(Worker, profile=["helper"]):
+            pass
+
+
+def test_subclasses_inherit_profiling_without_double_wrapping():
+    class Worker(profiling.ProfileMixin, sample_every=2):
+        def work(self):
+            return "work"
+
+    class Sub(Worker):
+        pass
+
+    class Listed(Worker, profile=["work"]):
+        pass
+
+    for cls in (Sub, Listed):
+        assert cls._profile_sample_every == 2
+        assert cls.work.__wrapped__ is Worker._profile_originals["work"]
+        cls().work()
+        assert cls.profile_snapshot()["work"]["calls"] == 1